@@ -1,20 +1,35 @@
 """Textual App root for TubeVault."""
 
+from __future__ import annotations
+
 import logging
 import os
-from typing import Any
+import sys
+from collections import deque
+from typing import TYPE_CHECKING, Any
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 
 from tubevault.core.config import load_config
 from tubevault.core.html_player import cleanup_temp_files
-from tubevault.screens.channel_select import ChannelSelectScreen
-from tubevault.screens.library_browser import LibraryBrowserScreen
-from tubevault.screens.sync_screen import SyncScreen
+from tubevault.utils.helpers import tubevault_root
+
+if TYPE_CHECKING:
+    # Screens are imported lazily in the handlers below so that startup only
+    # pays for the channel list; the sync screen in particular pulls in
+    # yt-dlp via tubevault.core.sync.
+    from tubevault.screens.channel_select import ChannelSelectScreen
+    from tubevault.screens.library_browser import LibraryBrowserScreen
 
 logger = logging.getLogger(__name__)
 
+# Maximum log lines kept per sync slot for replay when SyncScreen is reopened.
+SYNC_LOG_REPLAY_LIMIT = 500
+
+# Show the cursor and reset text attributes, sent as one write on hard exit.
+TERMINAL_RESET = "\x1b[?25h\x1b[0m"
+
 APP_CSS = """
 Screen {
     background: $background;
@@ -43,33 +58,46 @@ class TubeVaultApp(App):
     # ------------------------------------------------------------------ Sync state
     # These survive SyncScreen being popped so progress can be replayed
     # when the user navigates back to the sync view.
-    sync_running: bool = False
-    sync_slot_logs: list[list] = [[], [], [], []]  # per-slot log replay buffers
-    sync_progress: Any = None  # ChannelSyncProgress | None
+    sync_running: bool
+    sync_slot_logs: list[deque]  # per-slot log replay buffers
+    sync_progress: Any  # ChannelSyncProgress | None
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.sync_running = False
+        self.sync_progress = None
+        self.reset_sync_logs()
+
+    def reset_sync_logs(self) -> None:
+        """Replace the per-slot replay buffers with empty, bounded ones."""
+        self.sync_slot_logs = [deque(maxlen=SYNC_LOG_REPLAY_LIMIT) for _ in range(4)]
 
     def on_mount(self) -> None:
+        from tubevault.screens.channel_select import ChannelSelectScreen
         self.push_screen(ChannelSelectScreen())
 
     # ------------------------------------------------------------------ First-run
     def _ensure_first_run(self) -> None:
         """Initialize ~/TubeVault/ and prompt for first channel if needed."""
-        from tubevault.utils.helpers import tubevault_root
         tubevault_root()  # ensures dir exists
 
     # ------------------------------------------------------------------ Screen routing
     def on_channel_select_screen_channel_selected(
         self, event: ChannelSelectScreen.ChannelSelected
     ) -> None:
+        from tubevault.screens.library_browser import LibraryBrowserScreen
         self.push_screen(LibraryBrowserScreen(event.channel))
 
     def on_channel_select_screen_sync_all_requested(
         self, _: ChannelSelectScreen.SyncAllRequested
     ) -> None:
+        from tubevault.screens.sync_screen import SyncScreen
         self.push_screen(SyncScreen())
 
     def on_library_browser_screen_sync_channel_requested(
         self, event: LibraryBrowserScreen.SyncChannelRequested
     ) -> None:
+        from tubevault.screens.sync_screen import SyncScreen
         self.push_screen(
             SyncScreen(
                 channel_name=event.channel_name,
@@ -85,10 +113,9 @@ class TubeVaultApp(App):
         # shutdown(wait=True) which would otherwise stall the terminal for the
         # duration of whatever yt-dlp download is in flight.
         if self.sync_running:
-            cleanup_temp_files()
-            import sys
-            sys.stdout.write("\x1b[?25h")  # re-enable cursor before hard exit
+            sys.stdout.write(TERMINAL_RESET)  # restore the terminal before hard exit
             sys.stdout.flush()
+            cleanup_temp_files()
             os._exit(0)
         self.exit()
 
@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import sys
+import time
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +16,16 @@ logging.getLogger().addHandler(logging.NullHandler())
 
 logger = logging.getLogger(__name__)
 
+# Number of fetched publish dates buffered by --fix-dates before they are
+# written back to the library.
+FIX_DATES_FLUSH_BATCH = 200
+
+# Minimum seconds between redraws of the --fix-dates progress line.
+PROGRESS_INTERVAL = 0.1
+
+# Minimum seconds between headless --sync progress log lines.
+SYNC_LOG_INTERVAL = 0.5
+
 
 @click.command()
 @click.option("--sync", is_flag=True, default=False, help="Run headless sync and exit.")
@@ -58,17 +69,55 @@ def _configure_headless_logging(verbose: bool) -> None:
     )
 
 
+def _use_uvloop() -> None:
+    """Switch asyncio to uvloop for headless modes when it is available.
+
+    Not used for the TUI, where Textual manages its own event loop.
+    """
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop")
+
+
 def _run_sync(channel: str | None) -> None:
     """Headless sync mode."""
     from tubevault.core.config import load_config
     from tubevault.core.sync import sync_all_channels, sync_channel
 
+    _use_uvloop()
+
     config = load_config()
     quality = config.get("download_quality", "1080p")
     max_concurrent = config.get("max_concurrent_downloads", 2)
 
+    last_emit = 0.0
+    last_sig: tuple | None = None
+
     def _log_progress(prog: Any) -> None:
-        for vp in (v for v in (prog.slots or []) if v is not None):
+        # Progress fires on every download chunk.  Take a cheap snapshot of
+        # what would be printed and only format/log when it has changed, at
+        # most every SYNC_LOG_INTERVAL seconds unless a video just completed.
+        nonlocal last_emit, last_sig
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        active = [v for v in (prog.slots or []) if v is not None]
+        sig = (
+            prog.completed,
+            tuple((v.video_id, int(v.download * 100), v.transcript, v.summary) for v in active),
+        )
+        if sig == last_sig:
+            return
+        now = time.monotonic()
+        if last_sig is not None and sig[0] == last_sig[0] and now - last_emit < SYNC_LOG_INTERVAL:
+            return
+        last_emit = now
+        last_sig = sig
+        for vp in active:
             if vp.download >= 1.0:
                 dl = "done"
             elif vp.download < 0:
@@ -86,8 +135,7 @@ def _run_sync(channel: str | None) -> None:
             )
 
     if channel:
-        channels = config.get("channels", [])
-        ch = next((c for c in channels if c["name"] == channel), None)
+        ch = {c["name"]: c for c in config.get("channels", [])}.get(channel)
         if not ch:
             click.echo(f"Channel '{channel}' not found in config.", err=True)
             sys.exit(1)
@@ -109,10 +157,11 @@ def _run_sync(channel: str | None) -> None:
 def _run_fix_dates(channel: str | None) -> None:
     """Fetch per-video metadata concurrently and backfill missing publish dates."""
     from tubevault.core.config import load_config
-    from tubevault.core.database import batch_update_upload_dates, list_library_page_nums, load_library_page
-    from tubevault.core.downloader import fetch_video_metadata
+    from tubevault.core.database import batch_update_upload_dates, list_missing_date_video_ids
+    from tubevault.core.downloader import fetch_video_metadata_batch
     from tubevault.utils.helpers import load_proxy_url
 
+    _use_uvloop()
     config = load_config()
     channels_cfg = config.get("channels", [])
 
@@ -127,48 +176,71 @@ def _run_fix_dates(channel: str | None) -> None:
     # is safe.  Without a proxy, stay conservative to avoid rate-limiting.
     concurrency = 16 if proxy else 2
 
-    async def _fetch_dates(ch_name: str, video_ids: list[str]) -> dict[str, str]:
-        sem = asyncio.Semaphore(concurrency)
-        date_map: dict[str, str] = {}
-        completed = 0
-        total = len(video_ids)
-
-        async def _one(vid: str) -> None:
-            nonlocal completed
-            async with sem:
-                try:
-                    meta = await fetch_video_metadata(vid)
-                    if meta and meta.get("upload_date"):
-                        date_map[vid] = meta["upload_date"]
-                except Exception:
-                    pass
-            completed += 1
-            if completed % 20 == 0 or completed == total:
-                click.echo(f"\r  {ch_name}: {completed}/{total} fetched…   ", nl=False)
+    async def _fetch_dates(work: dict[str, list[str]]) -> dict[str, int]:
+        """Fetch dates for every channel through one shared worker pool.
 
-        await asyncio.gather(*[_one(vid) for vid in video_ids])
-        click.echo()  # newline after the progress line
-        return date_map
+        Channels are fetched together so the network work overlaps, while
+        *concurrency* still bounds the total number of in-flight requests.
+        Dates are written back per channel in batches.
 
-    total_updated = 0
+        Returns:
+            Number of entries updated, keyed by channel name.
+        """
+        channel_of = {vid: ch_name for ch_name, vids in work.items() for vid in vids}
+        pending: dict[str, dict[str, str]] = {ch_name: {} for ch_name in work}
+        updated = dict.fromkeys(work, 0)
+        completed = 0
+        total = len(channel_of)
+        # The \r-rewritten progress line is only useful on a terminal; when
+        # piped (e.g. from cron) it would just fill the log.
+        show_progress = sys.stdout.isatty()
+        last_print = 0.0
+
+        def _flush(ch_name: str) -> None:
+            # Runs on the event loop thread, so flushes never overlap.
+            if pending[ch_name]:
+                updated[ch_name] += batch_update_upload_dates(ch_name, pending[ch_name])
+                pending[ch_name] = {}
+
+        def _on_result(vid: str, meta: dict[str, Any] | None) -> None:
+            nonlocal completed, last_print
+            if meta and meta.get("upload_date"):
+                ch_name = channel_of[vid]
+                pending[ch_name][vid] = meta["upload_date"]
+                if len(pending[ch_name]) >= FIX_DATES_FLUSH_BATCH:
+                    _flush(ch_name)
+            completed += 1
+            if not show_progress:
+                return
+            now = time.monotonic()
+            if now - last_print >= PROGRESS_INTERVAL or completed == total:
+                last_print = now
+                click.echo(f"\r  {completed}/{total} fetched…   ", nl=False)
+
+        await fetch_video_metadata_batch(list(channel_of), concurrency, _on_result)
+        for ch_name in work:
+            _flush(ch_name)
+        if show_progress:
+            click.echo()  # newline after the progress line
+        return updated
+
+    work: dict[str, list[str]] = {}
     for ch in channels_cfg:
         ch_name = ch["name"]
-
-        missing_ids = [
-            v["video_id"]
-            for pn in list_library_page_nums(ch_name)
-            for v in load_library_page(ch_name, pn)["videos"]
-            if not v.get("upload_date")
-        ]
+        missing_ids = list_missing_date_video_ids(ch_name)
         if not missing_ids:
             click.echo(f"{ch_name}: all dates present, skipping.")
             continue
+        click.echo(f"{ch_name}: {len(missing_ids)} dates missing.")
+        work[ch_name] = missing_ids
 
-        click.echo(f"{ch_name}: {len(missing_ids)} dates missing, fetching (concurrency={concurrency})…")
-        date_map = asyncio.run(_fetch_dates(ch_name, missing_ids))
-        updated = batch_update_upload_dates(ch_name, date_map)
-        total_updated += updated
-        click.echo(f"{ch_name}: updated {updated} / {len(missing_ids)} entries.")
+    total_updated = 0
+    if work:
+        click.echo(f"Fetching {sum(map(len, work.values()))} dates (concurrency={concurrency})…")
+        updated = asyncio.run(_fetch_dates(work))
+        for ch_name, missing_ids in work.items():
+            total_updated += updated[ch_name]
+            click.echo(f"{ch_name}: updated {updated[ch_name]} / {len(missing_ids)} entries.")
 
     click.echo(f"\nDone. {total_updated} dates populated across all channels.")
 
@@ -188,7 +260,7 @@ def _run_export(channel: str | None, output: str | None, master_summary: bool) -
 
 def _run_tui() -> None:
     """Launch the Textual TUI."""
-    from tubevault.app import TubeVaultApp
+    from tubevault.app import TERMINAL_RESET, TubeVaultApp
 
     app = TubeVaultApp()
     try:
@@ -199,8 +271,8 @@ def _run_tui() -> None:
         # /dev/tty explicitly so the cursor is always restored.
         try:
             with open("/dev/tty", "w") as tty:
-                tty.write("\x1b[?25h")
+                tty.write(TERMINAL_RESET)
                 tty.flush()
         except OSError:
-            sys.stdout.write("\x1b[?25h")
+            sys.stdout.write(TERMINAL_RESET)
             sys.stdout.flush()
@@ -1,13 +1,16 @@
 """Global configuration management for TubeVault."""
 
+import copy
+import functools
 import json
 import logging
-import shutil
+import os
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
-from tubevault.utils.helpers import ensure_dir, tubevault_root
+from tubevault.utils.helpers import atomic_write_bytes, ensure_dir, json_dumps, json_loads, tubevault_root
 
 logger = logging.getLogger(__name__)
 
@@ -19,9 +22,14 @@ DEFAULT_CONFIG: dict[str, Any] = {
     "anthropic_api_key_env": "ANTHROPIC_API_KEY",
     "download_quality": "1080p",
     "max_concurrent_downloads": 2,
+    "batch_summaries": False,
 }
 
+# Last parsed config, keyed by (path, st_mtime_ns, st_size) of config.json.
+_CONFIG_CACHE: tuple[tuple[Path, int, int], dict[str, Any]] | None = None
 
+
+@functools.cache
 def config_path() -> Path:
     """Return the path to config.json.
 
@@ -31,28 +39,54 @@ def config_path() -> Path:
     return tubevault_root() / "config.json"
 
 
-def load_config() -> dict[str, Any]:
-    """Load and return the global config, creating defaults if missing.
+def _cache_key(path: Path) -> tuple[Path, int, int]:
+    """Return the cache key for a config file from its current stat."""
+    st = path.stat()
+    return (path, st.st_mtime_ns, st.st_size)
+
+
+def _load_cached() -> dict[str, Any]:
+    """Return the cached config dict itself, (re)loading it when stale.
+
+    The returned object is shared; only ``load_config`` (which copies it) and
+    ``_mutate_config`` (which persists it) may hand it on or modify it.
 
     Returns:
-        Config dict.
+        The cached config dict.
     """
+    global _CONFIG_CACHE
     path = config_path()
     if not path.exists():
-        save_config(DEFAULT_CONFIG.copy())
-        return DEFAULT_CONFIG.copy()
+        save_config(DEFAULT_CONFIG)
+        return _CONFIG_CACHE[1]
     try:
-        with path.open() as f:
-            data = json.load(f)
+        stamp = _cache_key(path)
+        if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == stamp:
+            return _CONFIG_CACHE[1]
+        data = json_loads(path.read_bytes())
         # Merge any missing keys from defaults
-        for key, value in DEFAULT_CONFIG.items():
-            data.setdefault(key, value)
+        for key in DEFAULT_CONFIG.keys() - data.keys():
+            data[key] = copy.deepcopy(DEFAULT_CONFIG[key])
+        _CONFIG_CACHE = (stamp, data)
         return data
     except (json.JSONDecodeError, OSError) as exc:
         logger.warning("Corrupted config.json — backing up and reinitializing: %s", exc)
         _backup_file(path)
-        save_config(DEFAULT_CONFIG.copy())
-        return DEFAULT_CONFIG.copy()
+        save_config(DEFAULT_CONFIG)
+        return _CONFIG_CACHE[1]
+
+
+def load_config() -> dict[str, Any]:
+    """Load and return the global config, creating defaults if missing.
+
+    The parsed config is cached in-process and reused until config.json's
+    mtime or size changes.  Callers always receive their own deep copy, so
+    mutating the result never affects the cache.
+
+    Returns:
+        Config dict.
+    """
+    return copy.deepcopy(_load_cached())
 
 
 def save_config(config: dict[str, Any]) -> None:
@@ -61,10 +95,40 @@ def save_config(config: dict[str, Any]) -> None:
     Args:
         config: Config dict to save.
     """
+    global _CONFIG_CACHE
     path = config_path()
     ensure_dir(path.parent)
-    with path.open("w") as f:
-        json.dump(config, f, indent=2)
+    atomic_write_bytes(path, json_dumps(config))
+    _CONFIG_CACHE = (_cache_key(path), copy.deepcopy(config))
+
+
+def _mutate_config(mutator: Callable[[dict[str, Any]], bool]) -> bool:
+    """Apply *mutator* to the cached config in place and persist it.
+
+    Avoids the copy-on-load / copy-on-save round trip of ``load_config`` +
+    ``save_config``.  Changes are written through immediately because the
+    TUI's hard-exit path skips ``atexit`` handlers.
+
+    Args:
+        mutator: Callable that edits the config and returns True if it
+            changed anything.
+
+    Returns:
+        The mutator's result.
+    """
+    global _CONFIG_CACHE
+    config = _load_cached()
+    try:
+        if not mutator(config):
+            return False
+        path = config_path()
+        atomic_write_bytes(path, json_dumps(config))
+        _CONFIG_CACHE = (_cache_key(path), config)
+    except BaseException:
+        # The cached dict may now differ from disk; force a reload.
+        _CONFIG_CACHE = None
+        raise
+    return True
 
 
 def _normalize_channel_url(url: str) -> str:
@@ -83,6 +147,18 @@ def _normalize_channel_url(url: str) -> str:
     return url
 
 
+def _by_name(config: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Index a config's channel entries by name.
+
+    Args:
+        config: Config dict.
+
+    Returns:
+        Mapping of channel name to its (mutable) entry in ``config["channels"]``.
+    """
+    return {c["name"]: c for c in config["channels"]}
+
+
 def add_channel(url: str, name: str, quality: str = "high") -> dict[str, Any]:
     """Add a channel to the config.
 
@@ -94,7 +170,6 @@ def add_channel(url: str, name: str, quality: str = "high") -> dict[str, Any]:
     Returns:
         The new channel entry dict.
     """
-    config = load_config()
     entry = {
         "name": name,
         "url": _normalize_channel_url(url),
@@ -102,8 +177,12 @@ def add_channel(url: str, name: str, quality: str = "high") -> dict[str, Any]:
         "added_date": datetime.now(timezone.utc).isoformat(),
         "auto_sync": True,
     }
-    config["channels"].append(entry)
-    save_config(config)
+
+    def _add(config: dict[str, Any]) -> bool:
+        config["channels"].append(dict(entry))
+        return True
+
+    _mutate_config(_add)
     return entry
 
 
@@ -124,18 +203,20 @@ def update_channel(
     Returns:
         True if the channel was found and updated, False otherwise.
     """
-    config = load_config()
-    for ch in config["channels"]:
-        if ch["name"] == name:
-            if new_name:
-                ch["name"] = new_name
-            if new_url:
-                ch["url"] = _normalize_channel_url(new_url)
-            if new_quality and new_quality in QUALITY_MAP:
-                ch["quality"] = new_quality
-            save_config(config)
-            return True
-    return False
+
+    def _update(config: dict[str, Any]) -> bool:
+        ch = _by_name(config).get(name)
+        if ch is None:
+            return False
+        if new_name:
+            ch["name"] = new_name
+        if new_url:
+            ch["url"] = _normalize_channel_url(new_url)
+        if new_quality and new_quality in QUALITY_MAP:
+            ch["quality"] = new_quality
+        return True
+
+    return _mutate_config(_update)
 
 
 def remove_channel(name: str) -> bool:
@@ -147,24 +228,31 @@ def remove_channel(name: str) -> bool:
     Returns:
         True if removed, False if not found.
     """
-    config = load_config()
-    original_len = len(config["channels"])
-    config["channels"] = [c for c in config["channels"] if c["name"] != name]
-    if len(config["channels"]) < original_len:
-        save_config(config)
+
+    def _remove(config: dict[str, Any]) -> bool:
+        ch = _by_name(config).get(name)
+        if ch is None:
+            return False
+        config["channels"].remove(ch)
         return True
-    return False
+
+    return _mutate_config(_remove)
 
 
 def _backup_file(path: Path) -> None:
-    """Back up a file by appending .bak to its name.
+    """Move a corrupted file aside to a timestamped ``.bad`` name.
+
+    A rename instead of a copy keeps every earlier backup and costs a single
+    metadata operation.  Missing files are ignored.
 
     Args:
         path: File to back up.
     """
-    backup = path.with_suffix(path.suffix + ".bak")
+    backup = path.with_name(f"{path.stem}.bad.{int(time.time())}{path.suffix}")
     try:
-        shutil.copy2(path, backup)
+        os.replace(path, backup)
         logger.info("Backed up %s to %s", path, backup)
+    except FileNotFoundError:
+        pass
     except OSError as exc:
         logger.error("Failed to back up %s: %s", path, exc)
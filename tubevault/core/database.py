@@ -1,20 +1,43 @@
 """Read/write library.json and collection.json for TubeVault."""
 
+import asyncio
+import functools
 import json
 import logging
-import re
-import shutil
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
 
-from tubevault.utils.helpers import ensure_dir, tubevault_root
+try:
+    import ijson
+except ImportError:  # ijson is optional; pages are parsed whole instead
+    ijson = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard is optional; bulky files stay plain JSON
+    zstandard = None
+
+from tubevault.utils.helpers import atomic_write_bytes, ensure_dir, json_dumps, json_loads, tubevault_root
 
 logger = logging.getLogger(__name__)
 
 # Maximum number of video entries stored in a single library page file.
 LIBRARY_PAGE_SIZE = 100
 
+# Upper bound on threads used by load_library to read pages concurrently.
+LIBRARY_LOAD_WORKERS = 8
+
+# zstd level for transcript/metadata files when zstandard is installed.
+ZSTD_LEVEL = 3
+
+# Longest time (seconds) a LibraryWriter holds a staged upsert before a timer
+# writes it out.  Sync also flushes whenever a video finishes processing.
+LIBRARY_FLUSH_INTERVAL = 5.0
+
 EMPTY_LIBRARY: dict[str, Any] = {
     "channel_name": "",
     "last_synced": None,
@@ -26,6 +49,28 @@ EMPTY_COLLECTION: dict[str, Any] = {
     "items": [],
 }
 
+# Parsed library pages and collections keyed by path, tagged with the
+# (st_mtime_ns, st_size) of the file they were read from.  A changed stamp
+# means the file was rewritten on disk and must be parsed again.
+_JSON_CACHE: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+# Legacy library.json paths already migrated (or found absent) this process.
+_MIGRATED: set[Path] = set()
+
+# Sorted page numbers per channel directory, tagged with the directory's
+# st_mtime_ns.  Dropped whenever this process writes a page.
+_PAGE_NUMS_CACHE: dict[Path, tuple[int, list[int]]] = {}
+
+# Parsed videos_index.tsv files keyed by path, tagged with the file's
+# (st_mtime_ns, st_size).  Kept current in place by this process's appends
+# and rebuilds; callers must treat the returned dict as read-only.
+_VIDEO_INDEX_CACHE: dict[Path, tuple[tuple[int, int], dict[str, int]]] = {}
+
+
+def _empty_library(channel_name: str) -> dict[str, Any]:
+    """Return a fresh empty library page (the ``EMPTY_LIBRARY`` shape)."""
+    return {"channel_name": channel_name, "last_synced": None, "videos": []}
+
 
 def channel_dir(channel_name: str) -> Path:
     """Return the directory for a channel's data.
@@ -59,45 +104,55 @@ def _legacy_library_path(channel_name: str) -> Path:
     return channel_dir(channel_name) / "library.json"
 
 
+def _video_index_path(channel_name: str) -> Path:
+    """Return the path to the video_id → page number index for a channel.
+
+    The index is an append-only log of ``<video_id>\t<page_num>`` lines.
+    """
+    return channel_dir(channel_name) / "videos_index.tsv"
+
+
 def collection_path(channel_name: str) -> Path:
     """Return the path to collection.json for a channel."""
     return channel_dir(channel_name) / "collection.json"
 
 
-def _load_json(path: Path, default: dict[str, Any]) -> dict[str, Any]:
+def _load_json(path: Path, default_factory: Callable[[], dict[str, Any]]) -> dict[str, Any]:
     """Load a JSON file, recovering from corruption.
 
     Args:
         path: File path.
-        default: Default value if file is missing or corrupted.
+        default_factory: Called to build the result if the file is missing or
+            corrupted; never called when the file loads successfully.
 
     Returns:
         Loaded dict.
     """
     if not path.exists():
-        return default.copy()
+        return default_factory()
     try:
-        with path.open() as f:
-            return json.load(f)
+        return json_loads(path.read_bytes())
     except (json.JSONDecodeError, OSError) as exc:
         logger.warning("Corrupted %s — backing up and reinitializing: %s", path, exc)
         _backup_json(path)
-        return default.copy()
+        return default_factory()
 
 
-def _save_json(path: Path, data: dict[str, Any]) -> None:
+def _save_json(path: Path, data: dict[str, Any], compact: bool = False) -> None:
     """Persist data as JSON to path.
 
     Args:
         path: Destination file path.
         data: Data to serialize.
+        compact: Write without indentation (for machine-only files).
     """
     ensure_dir(path.parent)
-    with path.open("w") as f:
-        json.dump(data, f, indent=2)
+    atomic_write_bytes(path, json_dumps(data, compact=compact))
 
 
 def _backup_json(path: Path) -> None:
+    import shutil  # only needed on the rare corruption path
+
     backup = path.with_suffix(".json.bak")
     try:
         shutil.copy2(path, backup)
@@ -105,22 +160,91 @@ def _backup_json(path: Path) -> None:
         pass
 
 
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    """Return ``(st_mtime_ns, st_size)`` for *path*, or None if it is missing."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _copy_doc(doc: dict[str, Any], list_key: str) -> dict[str, Any]:
+    """Copy a cached document deeply enough that callers may mutate it.
+
+    Library videos and collection items only hold scalar values, so copying
+    each entry dict under *list_key* is sufficient and far cheaper than
+    ``copy.deepcopy``.
+    """
+    return {**doc, list_key: [dict(x) for x in doc.get(list_key, [])]}
+
+
+def _load_cached_json(
+    path: Path, list_key: str, default_factory: Callable[[], dict[str, Any]]
+) -> dict[str, Any]:
+    """Load a JSON document through ``_JSON_CACHE``.
+
+    Args:
+        path: File path.
+        list_key: Key of the document's entry list (``videos`` / ``items``).
+        default_factory: Builds the result if the file is missing or corrupted.
+
+    Returns:
+        A private copy of the document, with *list_key* guaranteed present.
+    """
+    stamp = _file_stamp(path)
+    cached = _JSON_CACHE.get(path)
+    if stamp is not None and cached is not None and cached[0] == stamp:
+        return _copy_doc(cached[1], list_key)
+    data = _load_json(path, default_factory)
+    data.setdefault(list_key, [])
+    if stamp is not None:
+        _JSON_CACHE[path] = (stamp, _copy_doc(data, list_key))
+    return data
+
+
+def _save_cached_json(
+    path: Path, data: dict[str, Any], list_key: str, compact: bool = False
+) -> None:
+    """Save a JSON document and refresh its ``_JSON_CACHE`` entry.
+
+    Args:
+        path: Destination file path.
+        data: Document to persist.
+        list_key: Key of the document's entry list (``videos`` / ``items``).
+        compact: Write without indentation.
+    """
+    _save_json(path, data, compact=compact)
+    stamp = _file_stamp(path)
+    if stamp is not None:
+        _JSON_CACHE[path] = (stamp, _copy_doc(data, list_key))
+
+
 # ---------------------------------------------------------------------------
 # Library — paginated page files
 # ---------------------------------------------------------------------------
 
 def _list_page_nums_raw(channel_name: str) -> list[int]:
-    """Glob for library_NNN.json files without triggering migration.
+    """Scan for library_NNN.json files without triggering migration.
 
     Used internally by _migrate_library_if_needed to avoid circular calls.
     """
     cdir = channel_dir(channel_name)
+    mtime = cdir.stat().st_mtime_ns
+    cached = _PAGE_NUMS_CACHE.get(cdir)
+    if cached is not None and cached[0] == mtime:
+        return list(cached[1])
     nums: list[int] = []
-    for p in cdir.glob("library_*.json"):
-        m = re.match(r"^library_(\d+)\.json$", p.name)
-        if m:
-            nums.append(int(m.group(1)))
-    return sorted(nums)
+    with os.scandir(cdir) as it:
+        for entry in it:
+            name = entry.name
+            if name.startswith("library_") and name.endswith(".json"):
+                digits = name[8:-5]
+                if digits.isdigit():
+                    nums.append(int(digits))
+    nums.sort()
+    _PAGE_NUMS_CACHE[cdir] = (mtime, nums)
+    return list(nums)
 
 
 def list_library_page_nums(channel_name: str) -> list[int]:
@@ -142,12 +266,16 @@ def _migrate_library_if_needed(channel_name: str) -> None:
     """One-time migration: split legacy library.json into library_NNN.json pages.
 
     Safe to call repeatedly — exits immediately once migration is done.
+    Channels are only checked on disk once per process.
 
     Args:
         channel_name: Channel slug.
     """
     legacy = _legacy_library_path(channel_name)
+    if legacy in _MIGRATED:
+        return
     if not legacy.exists():
+        _MIGRATED.add(legacy)
         return  # Nothing to migrate
 
     existing_pages = _list_page_nums_raw(channel_name)
@@ -158,12 +286,17 @@ def _migrate_library_if_needed(channel_name: str) -> None:
             legacy.unlink()
         except OSError:
             pass
+        _MIGRATED.add(legacy)
         return
 
     logger.info("Migrating library.json → paged format for channel %s", channel_name)
-    default = {**EMPTY_LIBRARY, "channel_name": channel_name}
-    data = _load_json(legacy, default)
-    videos = sorted(data.get("videos", []), key=lambda v: v.get("upload_date", ""))
+    data = _load_json(legacy, lambda: _empty_library(channel_name))
+    raw_videos = data.get("videos", [])
+    # Decorate-sort-undecorate: tuples compare in C, the index keeps the sort
+    # stable, and ``or ""`` also tolerates null upload dates.
+    order = [(v.get("upload_date") or "", i) for i, v in enumerate(raw_videos)]
+    order.sort()
+    videos = [raw_videos[i] for _, i in order]
     last_synced = data.get("last_synced")
     ch_name = data.get("channel_name", channel_name)
 
@@ -179,7 +312,10 @@ def _migrate_library_if_needed(channel_name: str) -> None:
                 "last_synced": last_synced if is_last_page else None,
                 "videos": chunk,
             }
-            _save_json(library_page_path(channel_name, page_num), page_data)
+            save_library_page(channel_name, page_num, page_data)
+
+    # Any index predating the migration no longer matches the page layout.
+    _video_index_path(channel_name).unlink(missing_ok=True)
 
     # Remove the legacy file (back it up first).
     _backup_json(legacy)
@@ -187,6 +323,7 @@ def _migrate_library_if_needed(channel_name: str) -> None:
         legacy.unlink()
     except OSError:
         pass
+    _MIGRATED.add(legacy)
 
 
 def load_library_page(channel_name: str, page_num: int) -> dict[str, Any]:
@@ -200,23 +337,55 @@ def load_library_page(channel_name: str, page_num: int) -> dict[str, Any]:
         Page dict with ``channel_name``, ``last_synced``, and ``videos`` keys.
     """
     _migrate_library_if_needed(channel_name)
-    default = {**EMPTY_LIBRARY, "channel_name": channel_name}
     path = library_page_path(channel_name, page_num)
-    data = _load_json(path, default)
+    data = _load_cached_json(path, "videos", lambda: _empty_library(channel_name))
     data.setdefault("channel_name", channel_name)
-    data.setdefault("videos", [])
     return data
 
 
 def save_library_page(channel_name: str, page_num: int, data: dict[str, Any]) -> None:
     """Save a single library page file.
 
+    Pages are written as compact JSON; pipe them through ``python -m
+    json.tool`` to read them by hand.
+
     Args:
         channel_name: Channel slug.
         page_num: 1-based page number.
         data: Page dict to persist.
     """
-    _save_json(library_page_path(channel_name, page_num), data)
+    path = library_page_path(channel_name, page_num)
+    _save_cached_json(path, data, "videos", compact=True)
+    _PAGE_NUMS_CACHE.pop(path.parent, None)
+
+
+def iter_library_videos(channel_name: str) -> Iterator[dict[str, Any]]:
+    """Yield every video entry in the library, page by page.
+
+    Pages already held in the JSON cache are served from it; otherwise, when
+    ijson is installed, entries are streamed from the file one at a time so
+    consumers that stop early never parse the rest of the page.
+
+    Args:
+        channel_name: Channel slug.
+
+    Yields:
+        Video entry dicts in page order.
+    """
+    _migrate_library_if_needed(channel_name)
+    for pn in _list_page_nums_raw(channel_name):
+        path = library_page_path(channel_name, pn)
+        cached = _JSON_CACHE.get(path)
+        if ijson is None or (cached is not None and cached[0] == _file_stamp(path)):
+            yield from load_library_page(channel_name, pn)["videos"]
+            continue
+        try:
+            with path.open("rb") as f:
+                yield from ijson.items(f, "videos.item", use_float=True)
+        except FileNotFoundError:
+            continue
+        except ijson.JSONError as exc:
+            logger.warning("Skipping unreadable library page %s: %s", path, exc)
 
 
 def load_library(channel_name: str) -> dict[str, Any]:
@@ -235,13 +404,20 @@ def load_library(channel_name: str) -> dict[str, Any]:
     page_nums = list_library_page_nums(channel_name)
 
     if not page_nums:
-        return {**EMPTY_LIBRARY, "channel_name": channel_name}
+        return _empty_library(channel_name)
+
+    if len(page_nums) <= 2:
+        pages = [load_library_page(channel_name, pn) for pn in page_nums]
+    else:
+        # Overlap file reads and parsing across pages; map() keeps page order.
+        workers = min(LIBRARY_LOAD_WORKERS, len(page_nums))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pages = list(pool.map(lambda pn: load_library_page(channel_name, pn), page_nums))
 
     all_videos: list[dict[str, Any]] = []
     last_synced: str | None = None
 
-    for pn in page_nums:
-        page = load_library_page(channel_name, pn)
+    for page in pages:
         all_videos.extend(page.get("videos", []))
         if page.get("last_synced"):
             last_synced = page["last_synced"]  # highest page wins
@@ -253,10 +429,148 @@ def load_library(channel_name: str) -> dict[str, Any]:
     }
 
 
+def _rebuild_video_index(channel_name: str) -> dict[str, int]:
+    """Scan every library page and rewrite the video_id → page index.
+
+    Args:
+        channel_name: Channel slug.
+
+    Returns:
+        Mapping of ``video_id`` → 1-based page number.
+    """
+    index: dict[str, int] = {}
+    for pn in _list_page_nums_raw(channel_name):
+        for v in load_library_page(channel_name, pn)["videos"]:
+            index[v["video_id"]] = pn
+    data = "".join(f"{vid}\t{pn}\n" for vid, pn in index.items())
+    path = _video_index_path(channel_name)
+    atomic_write_bytes(path, data.encode("utf-8"))
+    stamp = _file_stamp(path)
+    if stamp is not None:
+        _VIDEO_INDEX_CACHE[path] = (stamp, index)
+    return index
+
+
+def _load_video_index(channel_name: str) -> dict[str, int]:
+    """Load the video_id → page index, rebuilding it only if it is missing.
+
+    The parsed index is cached until the file's stamp changes.  Malformed
+    lines (e.g. a torn final append) are skipped and later lines win; a file
+    holding more lines than videos is compacted in the same pass.
+
+    Args:
+        channel_name: Channel slug.
+
+    Returns:
+        Mapping of ``video_id`` → 1-based page number.  The dict is shared
+        with the cache and must not be modified.
+    """
+    path = _video_index_path(channel_name)
+    stamp = _file_stamp(path)
+    if stamp is None:
+        return _rebuild_video_index(channel_name)
+    cached = _VIDEO_INDEX_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        return _rebuild_video_index(channel_name)
+    index: dict[str, int] = {}
+    lines = raw.decode("utf-8", "replace").splitlines()
+    for line in lines:
+        vid, _, pn = line.partition("\t")
+        if vid and pn.isdigit():
+            index[vid] = int(pn)
+    if len(lines) > len(index):
+        # Superseded or torn lines: rewrite the file with one line per video.
+        data = "".join(f"{vid}\t{pn}\n" for vid, pn in index.items())
+        atomic_write_bytes(path, data.encode("utf-8"))
+        stamp = _file_stamp(path)
+        if stamp is None:
+            return index
+    _VIDEO_INDEX_CACHE[path] = (stamp, index)
+    return index
+
+
+def _append_video_index(channel_name: str, added: dict[str, int]) -> None:
+    """Record new videos' pages by appending lines to the index.
+
+    A cached copy that was current before the append is updated in place;
+    otherwise it is dropped and the next load re-reads the file.
+
+    Args:
+        channel_name: Channel slug.
+        added: Mapping of new ``video_id`` → 1-based page number.
+    """
+    path = _video_index_path(channel_name)
+    before = _file_stamp(path)
+    data = "".join(f"{vid}\t{pn}\n" for vid, pn in added.items())
+    with path.open("ab") as f:
+        f.write(data.encode("utf-8"))
+    cached = _VIDEO_INDEX_CACHE.pop(path, None)
+    stamp = _file_stamp(path)
+    if cached is not None and cached[0] == before and stamp is not None:
+        cached[1].update(added)
+        _VIDEO_INDEX_CACHE[path] = (stamp, cached[1])
+
+
+def _locate_video(
+    channel_name: str, video_id: str
+) -> tuple[int, dict[str, Any], int] | None:
+    """Find the page holding *video_id* via the index.
+
+    A stale index entry (the video is not on the recorded page) triggers a
+    single rebuild from the page files before giving up.
+
+    Args:
+        channel_name: Channel slug.
+        video_id: YouTube video ID.
+
+    Returns:
+        ``(page_num, page, position)`` or None if the video is not stored.
+    """
+    index = _load_video_index(channel_name)
+    for attempt in range(2):
+        pn = index.get(video_id)
+        if pn is None:
+            return None
+        page = load_library_page(channel_name, pn)
+        for i, v in enumerate(page["videos"]):
+            if v["video_id"] == video_id:
+                return pn, page, i
+        if attempt == 0:
+            logger.debug("Video index for %s is stale; rebuilding", channel_name)
+            index = _rebuild_video_index(channel_name)
+    return None
+
+
+def _stream_find_video(path: Path, video_id: str) -> dict[str, Any] | None:
+    """Stream a library page with ijson and return the entry for *video_id*.
+
+    Args:
+        path: Library page file.
+        video_id: YouTube video ID.
+
+    Returns:
+        The matching entry, or None if it is absent or the file is unreadable.
+    """
+    try:
+        with path.open("rb") as f:
+            for entry in ijson.items(f, "videos.item", use_float=True):
+                if entry.get("video_id") == video_id:
+                    return entry
+    except (OSError, ijson.JSONError) as exc:
+        logger.debug("Streaming lookup in %s failed: %s", path, exc)
+    return None
+
+
 def get_video_entry(channel_name: str, video_id: str) -> dict[str, Any] | None:
     """Retrieve a single video entry from the library.
 
-    Searches pages from newest to oldest for efficiency.
+    Uses the video index to read only the page that holds the entry.  When
+    that page is not cached and ijson is installed, the page is streamed and
+    parsing stops at the matching entry.
 
     Args:
         channel_name: Channel slug.
@@ -266,12 +580,21 @@ def get_video_entry(channel_name: str, video_id: str) -> dict[str, Any] | None:
         Video entry dict, or None if not found.
     """
     _migrate_library_if_needed(channel_name)
-    for pn in reversed(list_library_page_nums(channel_name)):
-        page = load_library_page(channel_name, pn)
-        for v in page.get("videos", []):
-            if v["video_id"] == video_id:
-                return v
-    return None
+    if ijson is not None:
+        pn = _load_video_index(channel_name).get(video_id)
+        if pn is None:
+            return None
+        path = library_page_path(channel_name, pn)
+        cached = _JSON_CACHE.get(path)
+        if cached is None or cached[0] != _file_stamp(path):
+            entry = _stream_find_video(path, video_id)
+            if entry is not None:
+                return entry
+    found = _locate_video(channel_name, video_id)
+    if found is None:
+        return None
+    _, page, i = found
+    return page["videos"][i]
 
 
 def upsert_video(channel_name: str, entry: dict[str, Any]) -> None:
@@ -285,50 +608,157 @@ def upsert_video(channel_name: str, entry: dict[str, Any]) -> None:
         channel_name: Channel slug.
         entry: Video entry dict containing at minimum ``video_id``.
     """
-    _migrate_library_if_needed(channel_name)
-    video_id = entry["video_id"]
-    page_nums = list_library_page_nums(channel_name)
+    upsert_videos_bulk(channel_name, [entry])
 
-    # Search existing pages, newest first (most likely to have recent videos).
-    for pn in reversed(page_nums):
-        page = load_library_page(channel_name, pn)
-        for i, v in enumerate(page["videos"]):
-            if v["video_id"] == video_id:
-                page["videos"][i] = {**v, **entry}
-                save_library_page(channel_name, pn, page)
-                return
 
-    # New video — add to the last page or create a new one.
-    entry.setdefault("added_date", datetime.now(timezone.utc).isoformat())
+def upsert_videos_bulk(channel_name: str, entries: Iterable[dict[str, Any]]) -> None:
+    """Insert or update many video entries, writing each touched page once.
 
-    if not page_nums:
-        _save_json(
-            library_page_path(channel_name, 1),
-            {"channel_name": channel_name, "last_synced": None, "videos": [entry]},
-        )
+    Same semantics as calling ``upsert_video`` for each entry in order, but
+    all changes are applied in memory first; every dirty page is then saved a
+    single time and new ids are appended to the index in one write.
+
+    Args:
+        channel_name: Channel slug.
+        entries: Video entry dicts, each containing at minimum ``video_id``.
+    """
+    _migrate_library_if_needed(channel_name)
+    entries = list(entries)
+    if not entries:
         return
+    now = datetime.now(timezone.utc).isoformat()
+    index = _load_video_index(channel_name)
+
+    for attempt in range(2):
+        pages: dict[int, dict[str, Any]] = {}
+        positions: dict[int, dict[str, int]] = {}
+        dirty: set[int] = set()
+        added: dict[str, int] = {}
+        page_nums = list_library_page_nums(channel_name)
+        last_pn = page_nums[-1] if page_nums else 0
+        stale = False
+
+        def _page(pn: int) -> tuple[dict[str, Any], dict[str, int]]:
+            if pn not in pages:
+                # A page that does not exist yet loads as an empty page.
+                pages[pn] = load_library_page(channel_name, pn)
+                positions[pn] = {v["video_id"]: i for i, v in enumerate(pages[pn]["videos"])}
+            return pages[pn], positions[pn]
+
+        for entry in entries:
+            video_id = entry["video_id"]
+            pn = added.get(video_id) or index.get(video_id)
+            if pn is not None:
+                page, pos = _page(pn)
+                i = pos.get(video_id)
+                if i is not None:
+                    page["videos"][i] = {**page["videos"][i], **entry}
+                    dirty.add(pn)
+                    continue
+                if attempt == 0:
+                    stale = True
+                    break
+
+            # New video — add to the last page or start a new one.
+            entry.setdefault("added_date", now)
+            if last_pn == 0 or len(_page(last_pn)[0]["videos"]) >= LIBRARY_PAGE_SIZE:
+                last_pn += 1
+            page, pos = _page(last_pn)
+            pos[video_id] = len(page["videos"])
+            page["videos"].append(entry)
+            dirty.add(last_pn)
+            added[video_id] = last_pn
+
+        if not stale:
+            break
+        logger.debug("Video index for %s is stale; rebuilding", channel_name)
+        index = _rebuild_video_index(channel_name)
+
+    # Index first: an entry whose page write never lands is detected as stale
+    # and rebuilt, whereas a missing entry would let the next upsert append a
+    # duplicate.
+    if added:
+        _append_video_index(channel_name, added)
+    for pn in sorted(dirty):
+        save_library_page(channel_name, pn, pages[pn])
+
+
+class LibraryWriter:
+    """Coalesce library upserts and write them in bulk.
+
+    Entries staged with ``upsert`` are merged per video and written through
+    ``upsert_videos_bulk`` by a timer at most ``flush_interval`` seconds after
+    the first of them was staged, on an explicit ``flush``, and when the
+    writer is closed.  A sync that flips several flags per video therefore
+    rewrites each page a few times instead of once per state change.  Staged
+    changes are not visible to readers until they are flushed.
+
+    The timer needs a running event loop; without one, ``upsert`` flushes
+    inline once the interval has passed since the last write.
+
+    Use as a context manager so the final flush always happens::
+
+        with LibraryWriter() as writer:
+            writer.upsert(channel_name, {"video_id": vid, "has_video": True})
+    """
 
-    last_pn = page_nums[-1]
-    last_page = load_library_page(channel_name, last_pn)
+    def __init__(self, flush_interval: float = LIBRARY_FLUSH_INTERVAL) -> None:
+        self._flush_interval = flush_interval
+        self._pending: dict[str, dict[str, dict[str, Any]]] = {}
+        self._last_flush = time.monotonic()
+        self._timer: asyncio.TimerHandle | None = None
 
-    if len(last_page["videos"]) < LIBRARY_PAGE_SIZE:
-        last_page["videos"].append(entry)
-        save_library_page(channel_name, last_pn, last_page)
-    else:
-        new_pn = last_pn + 1
-        _save_json(
-            library_page_path(channel_name, new_pn),
-            {"channel_name": channel_name, "last_synced": None, "videos": [entry]},
-        )
+    def __enter__(self) -> "LibraryWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.flush()
+
+    def upsert(self, channel_name: str, entry: dict[str, Any]) -> None:
+        """Stage an upsert; same arguments and semantics as ``upsert_video``.
+
+        Args:
+            channel_name: Channel slug.
+            entry: Video entry dict containing at minimum ``video_id``.
+        """
+        staged = self._pending.setdefault(channel_name, {}).setdefault(entry["video_id"], {})
+        staged.update(entry)
+        if self._timer is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            if time.monotonic() - self._last_flush >= self._flush_interval:
+                self.flush()
+            return
+        self._timer = loop.call_later(self._flush_interval, self._timed_flush)
+
+    def flush(self) -> None:
+        """Write all staged entries, one bulk upsert per channel."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, {}
+        self._last_flush = time.monotonic()
+        for channel_name, entries in pending.items():
+            upsert_videos_bulk(channel_name, entries.values())
+
+    def _timed_flush(self) -> None:
+        """Timer callback: flush, logging instead of raising into the loop."""
+        self._timer = None
+        try:
+            self.flush()
+        except Exception as exc:
+            logger.error("Deferred library flush failed: %s", exc)
 
 
 def batch_update_upload_dates(channel_name: str, date_map: dict[str, str]) -> int:
     """Backfill upload_date for library entries that are currently empty.
 
-    Reads each page once, patches every entry whose video_id appears in
-    *date_map* and whose current upload_date is falsy, then writes the page
-    once only if any entry was changed.  O(pages) disk operations regardless
-    of how many dates are updated.
+    Uses the video index to group *date_map* by page, loads only the pages
+    that hold one of the ids, patches every entry whose current upload_date
+    is falsy, and writes each dirty page exactly once after all patches are
+    applied.
 
     Args:
         channel_name: Channel slug.
@@ -338,21 +768,59 @@ def batch_update_upload_dates(channel_name: str, date_map: dict[str, str]) -> in
         Number of library entries updated.
     """
     _migrate_library_if_needed(channel_name)
-    updated = 0
-    for pn in _list_page_nums_raw(channel_name):
-        page = load_library_page(channel_name, pn)
-        changed = False
-        for v in page["videos"]:
-            vid = v.get("video_id", "")
-            if vid in date_map and not v.get("upload_date"):
-                v["upload_date"] = date_map[vid]
-                updated += 1
-                changed = True
-        if changed:
-            save_library_page(channel_name, pn, page)
+    index = _load_video_index(channel_name)
+    for attempt in range(2):
+        by_page: dict[int, list[str]] = {}
+        for vid in date_map:
+            pn = index.get(vid)
+            if pn is not None:
+                by_page.setdefault(pn, []).append(vid)
+
+        dirty: dict[int, dict[str, Any]] = {}
+        updated = 0
+        stale = False
+        for pn, vids in by_page.items():
+            page = load_library_page(channel_name, pn)
+            entries = {v.get("video_id", ""): v for v in page["videos"]}
+            for vid in vids:
+                v = entries.get(vid)
+                if v is None:
+                    stale = True
+                elif not v.get("upload_date"):
+                    v["upload_date"] = date_map[vid]
+                    updated += 1
+                    dirty[pn] = page
+        if not stale or attempt:
+            break
+        logger.debug("Video index for %s is stale; rebuilding", channel_name)
+        index = _rebuild_video_index(channel_name)
+
+    for pn, page in dirty.items():
+        save_library_page(channel_name, pn, page)
     return updated
 
 
+def list_missing_date_video_ids(channel_name: str) -> list[str]:
+    """Return the IDs of library entries whose upload_date is empty.
+
+    Runs migration once and reads each page a single time, returning only
+    the matching IDs rather than the full page contents.
+
+    Args:
+        channel_name: Channel slug.
+
+    Returns:
+        Video IDs missing an upload_date, in page order.
+    """
+    _migrate_library_if_needed(channel_name)
+    return [
+        v["video_id"]
+        for pn in _list_page_nums_raw(channel_name)
+        for v in load_library_page(channel_name, pn)["videos"]
+        if not v.get("upload_date")
+    ]
+
+
 def mark_library_synced(channel_name: str) -> None:
     """Update last_synced timestamp in the highest-numbered library page.
 
@@ -365,8 +833,9 @@ def mark_library_synced(channel_name: str) -> None:
 
     if not page_nums:
         # No videos yet; create page 1 to record the sync timestamp.
-        _save_json(
-            library_page_path(channel_name, 1),
+        save_library_page(
+            channel_name,
+            1,
             {"channel_name": channel_name, "last_synced": now, "videos": []},
         )
         return
@@ -390,10 +859,12 @@ def load_collection(channel_name: str) -> dict[str, Any]:
     Returns:
         Collection dict.
     """
-    default = {**EMPTY_COLLECTION, "channel_name": channel_name}
-    data = _load_json(collection_path(channel_name), default)
+    data = _load_cached_json(
+        collection_path(channel_name),
+        "items",
+        lambda: {"channel_name": channel_name, "items": []},
+    )
     data.setdefault("channel_name", channel_name)
-    data.setdefault("items", [])
     return data
 
 
@@ -404,7 +875,23 @@ def save_collection(channel_name: str, collection: dict[str, Any]) -> None:
         channel_name: Channel slug.
         collection: Collection dict to save.
     """
-    _save_json(collection_path(channel_name), collection)
+    _save_cached_json(collection_path(channel_name), collection, "items")
+
+
+def _collection_video_positions(items: list[dict[str, Any]]) -> dict[str, int]:
+    """Map each video_id in a collection to the index of its first item.
+
+    Args:
+        items: Collection ``items`` list.
+
+    Returns:
+        Mapping of ``video_id`` → 0-based position in *items*.
+    """
+    positions: dict[str, int] = {}
+    for i, item in enumerate(items):
+        if item.get("type") == "video":
+            positions.setdefault(item.get("video_id"), i)
+    return positions
 
 
 def collection_add_video(channel_name: str, video_id: str) -> bool:
@@ -418,9 +905,8 @@ def collection_add_video(channel_name: str, video_id: str) -> bool:
         True if added, False if already present.
     """
     collection = load_collection(channel_name)
-    for item in collection["items"]:
-        if item.get("type") == "video" and item.get("video_id") == video_id:
-            return False
+    if video_id in _collection_video_positions(collection["items"]):
+        return False
     collection["items"].append(
         {
             "type": "video",
@@ -470,13 +956,11 @@ def collection_insert_header(channel_name: str, index: int, text: str) -> None:
         index: Position to insert before.
         text: Header text.
     """
-    import uuid
-
     collection = load_collection(channel_name)
     header = {
         "type": "section_header",
         "text": text,
-        "id": f"sec_{uuid.uuid4().hex[:8]}",
+        "id": f"sec_{os.urandom(4).hex()}",
     }
     collection["items"].insert(index, header)
     save_collection(channel_name, collection)
@@ -491,11 +975,10 @@ def collection_set_note(channel_name: str, video_id: str, note: str) -> None:
         note: Note text.
     """
     collection = load_collection(channel_name)
-    for item in collection["items"]:
-        if item.get("type") == "video" and item.get("video_id") == video_id:
-            item["note"] = note
-            save_collection(channel_name, collection)
-            return
+    pos = _collection_video_positions(collection["items"]).get(video_id)
+    if pos is not None:
+        collection["items"][pos]["note"] = note
+        save_collection(channel_name, collection)
 
 
 # ---------------------------------------------------------------------------
@@ -512,9 +995,61 @@ def video_dir(channel_name: str, video_id: str) -> Path:
     Returns:
         Path to ~/TubeVault/videos/<channel>/<video_id>/.
     """
-    path = channel_dir(channel_name) / video_id
-    ensure_dir(path)
-    return path
+    return ensure_dir(_video_dir_path(channel_name, video_id))
+
+
+@functools.lru_cache(maxsize=4096)
+def _video_dir_path(channel_name: str, video_id: str) -> Path:
+    """Build (and memoize) the path returned by ``video_dir``."""
+    return tubevault_root() / "videos" / channel_name / video_id
+
+
+def _zst_path(path: Path) -> Path:
+    """Return the ``.zst`` sibling of a JSON file."""
+    return path.with_name(path.name + ".zst")
+
+
+def _save_json_compressed(path: Path, data: dict[str, Any]) -> None:
+    """Save a rarely-read JSON file, zstd-compressed when available.
+
+    Writes ``<path>.zst`` and removes any plain copy; without zstandard the
+    file is written as plain JSON at *path*.
+
+    Args:
+        path: Plain JSON file path.
+        data: Data to serialize.
+    """
+    if zstandard is None:
+        _save_json(path, data)
+        return
+    raw = json_dumps(data, compact=True)
+    atomic_write_bytes(_zst_path(path), zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw))
+    path.unlink(missing_ok=True)
+
+
+def _load_json_compressed(path: Path) -> dict[str, Any] | None:
+    """Load a file written by ``_save_json_compressed``.
+
+    Prefers ``<path>.zst`` and falls back to the plain JSON file.
+
+    Args:
+        path: Plain JSON file path.
+
+    Returns:
+        Loaded dict, or None if neither file exists or can be read.
+    """
+    zst = _zst_path(path)
+    if zstandard is not None and zst.exists():
+        try:
+            return json_loads(zstandard.ZstdDecompressor().decompress(zst.read_bytes()))
+        except (zstandard.ZstdError, json.JSONDecodeError, OSError) as exc:
+            logger.warning("Unreadable %s: %s", zst, exc)
+            return None
+    if not path.exists():
+        if zst.exists():
+            logger.warning("%s needs the zstandard package to read", zst)
+        return None
+    return _load_json(path, dict)
 
 
 def load_summary(channel_name: str, video_id: str) -> dict[str, Any] | None:
@@ -530,7 +1065,7 @@ def load_summary(channel_name: str, video_id: str) -> dict[str, Any] | None:
     path = video_dir(channel_name, video_id) / "summary.json"
     if not path.exists():
         return None
-    return _load_json(path, {})
+    return _load_json(path, dict)
 
 
 def save_summary(channel_name: str, video_id: str, summary: dict[str, Any]) -> None:
@@ -541,12 +1076,79 @@ def save_summary(channel_name: str, video_id: str, summary: dict[str, Any]) -> N
         video_id: YouTube video ID.
         summary: Summary dict.
     """
-    path = video_dir(channel_name, video_id) / "summary.json"
-    _save_json(path, summary)
+    vdir = video_dir(channel_name, video_id)
+    _save_json(vdir / "summary.json", summary)
+    # The rendered Markdown was derived from the previous summary.
+    (vdir / "summary.md").unlink(missing_ok=True)
+
+
+def load_summary_markdown(channel_name: str, video_id: str) -> str | None:
+    """Load the cached Markdown rendering of a video's summary.
+
+    Args:
+        channel_name: Channel slug.
+        video_id: YouTube video ID.
+
+    Returns:
+        Markdown text, or None if it has not been rendered yet.
+    """
+    path = video_dir(channel_name, video_id) / "summary.md"
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def save_summary_markdown(channel_name: str, video_id: str, text: str) -> None:
+    """Cache the Markdown rendering of a video's summary as summary.md.
+
+    The cache is dropped whenever ``save_summary`` writes a new summary.
+
+    Args:
+        channel_name: Channel slug.
+        video_id: YouTube video ID.
+        text: Rendered Markdown.
+    """
+    atomic_write_bytes(video_dir(channel_name, video_id) / "summary.md", text.encode("utf-8"))
+
+
+def load_summary_batch(channel_name: str) -> dict[str, Any] | None:
+    """Load the channel's pending Message Batch record (summary_batch.json).
+
+    Args:
+        channel_name: Channel slug.
+
+    Returns:
+        Dict with ``batch_id``, ``video_ids`` and ``submitted`` keys, or None
+        if no batch is pending.
+    """
+    path = channel_dir(channel_name) / "summary_batch.json"
+    if not path.exists():
+        return None
+    return _load_json(path, dict) or None
+
+
+def save_summary_batch(channel_name: str, record: dict[str, Any]) -> None:
+    """Record a submitted summary batch so a later sync can collect it.
+
+    Args:
+        channel_name: Channel slug.
+        record: Dict with ``batch_id``, ``video_ids`` and ``submitted`` keys.
+    """
+    _save_json(channel_dir(channel_name) / "summary_batch.json", record)
+
+
+def clear_summary_batch(channel_name: str) -> None:
+    """Forget the channel's pending summary batch.
+
+    Args:
+        channel_name: Channel slug.
+    """
+    (channel_dir(channel_name) / "summary_batch.json").unlink(missing_ok=True)
 
 
 def load_transcript(channel_name: str, video_id: str) -> list[dict[str, Any]] | None:
-    """Load transcript.json for a video.
+    """Load transcript.json (or transcript.json.zst) for a video.
 
     Args:
         channel_name: Channel slug.
@@ -555,15 +1157,14 @@ def load_transcript(channel_name: str, video_id: str) -> list[dict[str, Any]] |
     Returns:
         List of transcript segments, or None if not found.
     """
-    path = video_dir(channel_name, video_id) / "transcript.json"
-    if not path.exists():
+    data = _load_json_compressed(video_dir(channel_name, video_id) / "transcript.json")
+    if data is None:
         return None
-    data = _load_json(path, {})
     return data.get("segments") if isinstance(data, dict) else data
 
 
 def save_transcript(channel_name: str, video_id: str, segments: list[dict[str, Any]]) -> None:
-    """Save transcript.json for a video.
+    """Save transcript.json for a video (zstd-compressed when available).
 
     Args:
         channel_name: Channel slug.
@@ -571,11 +1172,11 @@ def save_transcript(channel_name: str, video_id: str, segments: list[dict[str, A
         segments: List of transcript segment dicts with text and start keys.
     """
     path = video_dir(channel_name, video_id) / "transcript.json"
-    _save_json(path, {"segments": segments})
+    _save_json_compressed(path, {"segments": segments})
 
 
 def load_metadata(channel_name: str, video_id: str) -> dict[str, Any] | None:
-    """Load metadata.json for a video.
+    """Load metadata.json (or metadata.json.zst) for a video.
 
     Args:
         channel_name: Channel slug.
@@ -584,14 +1185,11 @@ def load_metadata(channel_name: str, video_id: str) -> dict[str, Any] | None:
     Returns:
         Metadata dict, or None if not found.
     """
-    path = video_dir(channel_name, video_id) / "metadata.json"
-    if not path.exists():
-        return None
-    return _load_json(path, {})
+    return _load_json_compressed(video_dir(channel_name, video_id) / "metadata.json")
 
 
 def save_metadata(channel_name: str, video_id: str, metadata: dict[str, Any]) -> None:
-    """Save metadata.json for a video.
+    """Save metadata.json for a video (zstd-compressed when available).
 
     Args:
         channel_name: Channel slug.
@@ -599,4 +1197,4 @@ def save_metadata(channel_name: str, video_id: str, metadata: dict[str, Any]) ->
         metadata: Metadata dict.
     """
     path = video_dir(channel_name, video_id) / "metadata.json"
-    _save_json(path, metadata)
+    _save_json_compressed(path, metadata)
@@ -1,11 +1,17 @@
 """yt-dlp wrapper for downloading videos, metadata, and thumbnails."""
 
 import asyncio
+import contextlib
+import functools
 import logging
 import math
+import os
 import re
+import threading
+import time
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
 import yt_dlp
 
@@ -16,6 +22,13 @@ logger = logging.getLogger(__name__)
 
 LogCallback = Callable[[str], None]
 
+# Minimum seconds between download progress reports forwarded to the caller.
+PROGRESS_MIN_INTERVAL = 0.1
+
+# Idle YoutubeDL instances keyed by (purpose, proxy URL); see _pooled_ydl.
+_YDL_POOL: dict[tuple[str, str | None], list[yt_dlp.YoutubeDL]] = {}
+_YDL_POOL_LOCK = threading.Lock()
+
 # yt-dlp debug lines that are just download progress noise (handled by the
 # progress bar instead).
 _PROGRESS_RE = re.compile(r"\[download\].*?(?:\d+\.\d+%|ETA|at\s+\d)")
@@ -46,22 +59,23 @@ class _YdlLogger:
         self._cb = callback
 
     def debug(self, msg: str) -> None:
-        # yt-dlp sends download progress as debug; skip the noise
-        if _PROGRESS_RE.search(msg):
+        # yt-dlp sends download progress as debug; skip the noise.  The cheap
+        # prefix check keeps the regex off every other debug line.
+        if msg.startswith("[download]") and _PROGRESS_RE.match(msg):
             return
-        if msg.strip():
+        if msg and not msg.isspace():
             self._cb(msg)
 
     def info(self, msg: str) -> None:
-        if msg.strip():
+        if msg and not msg.isspace():
             self._cb(msg)
 
     def warning(self, msg: str) -> None:
-        if msg.strip():
+        if msg and not msg.isspace():
             self._cb(msg)  # yt-dlp already prefixes with "WARNING: "
 
     def error(self, msg: str) -> None:
-        if msg.strip():
+        if msg and not msg.isspace():
             self._cb(msg)  # yt-dlp already prefixes with "ERROR: "
 
 
@@ -108,6 +122,7 @@ def _ydl_opts_base(
     return opts
 
 
+@functools.lru_cache(maxsize=128)
 def _videos_url(channel_url: str) -> str:
     """Normalize a channel URL/handle and point it at the /videos tab.
 
@@ -166,6 +181,9 @@ def _fetch_channel_videos_sync(
 
     opts: dict[str, Any] = {
         "extract_flat": True,
+        # Resolve entries page by page as they are consumed, so breaking out
+        # at a stop_at_ids hit also stops fetching further listing pages.
+        "lazy_playlist": True,
         "ignoreerrors": True,
         "quiet": True,
         "no_warnings": True,
@@ -231,22 +249,19 @@ def _fetch_channel_videos_sync(
             if not upload_date:
                 ts = entry.get("timestamp")
                 if ts:
-                    from datetime import datetime, timezone
                     dt = datetime.fromtimestamp(float(ts), tz=timezone.utc)
                     upload_date = dt.strftime("%Y-%m-%d")
 
+            # has_video / has_transcript / has_summary / file_size_mb are
+            # left out: readers treat a missing flag as False, and sync sets
+            # them as each stage completes.
             results.append(
                 {
                     "video_id": video_id,
                     "title": entry.get("title", ""),
                     "upload_date": upload_date,
                     "duration_seconds": entry.get("duration") or 0,
-                    "description": entry.get("description", ""),
                     "thumbnail_url": entry.get("thumbnail", ""),
-                    "has_video": False,
-                    "has_transcript": False,
-                    "has_summary": False,
-                    "file_size_mb": 0.0,
                 }
             )
 
@@ -257,11 +272,13 @@ def _fetch_channel_videos_sync(
     return results
 
 
+@functools.lru_cache(maxsize=8192)
 def _parse_date(raw: Any) -> str:
     """Convert a yt-dlp date value to YYYY-MM-DD format.
 
     Accepts YYYYMMDD strings (yt-dlp's standard output) or Unix timestamps.
-    Returns an empty string if the input is falsy or unrecognisable.
+    Returns an empty string if the input is falsy or unrecognisable.  Results
+    are memoized; *raw* must be hashable (yt-dlp emits str, int or None).
     """
     if not raw:
         return ""
@@ -294,9 +311,54 @@ async def download_video(
     out_dir = video_dir(channel_name, video_id)
     ensure_dir(out_dir)
 
+    if progress_callback:
+        progress_callback = _coalesced_progress(progress_callback, asyncio.get_running_loop())
     return await run_in_daemon_thread(_download_sync, url, out_dir, quality, progress_callback, log_callback)
 
 
+def _coalesced_progress(
+    callback: Callable[[float, int, int], None],
+    loop: asyncio.AbstractEventLoop,
+) -> Callable[[float, int, int], None]:
+    """Wrap a progress callback so yt-dlp's hook thread never calls it directly.
+
+    Reports are handed to the event loop with ``call_soon_threadsafe``; at most
+    one delivery is pending at a time (later reports overwrite the queued
+    values) and intermediate reports arrive no more than once every
+    ``PROGRESS_MIN_INTERVAL`` seconds.  Completion (1.0) is always delivered.
+
+    Args:
+        callback: Callable receiving ``(fraction, downloaded, total)``.
+        loop: Event loop to deliver reports on.
+
+    Returns:
+        Thread-safe callable with the same signature.
+    """
+    lock = threading.Lock()
+    latest: list[tuple[float, int, int]] = []
+    state = {"scheduled": False, "last": 0.0}
+
+    def _deliver() -> None:
+        with lock:
+            args = latest[-1]
+            state["scheduled"] = False
+        callback(*args)
+
+    def _report(pct: float, downloaded: int, total: int) -> None:
+        now = time.monotonic()
+        with lock:
+            latest[:] = [(pct, downloaded, total)]
+            if state["scheduled"]:
+                return
+            if pct < 1.0 and now - state["last"] < PROGRESS_MIN_INTERVAL:
+                return
+            state["scheduled"] = True
+            state["last"] = now
+        loop.call_soon_threadsafe(_deliver)
+
+    return _report
+
+
 def _download_sync(
     url: str,
     out_dir: Path,
@@ -351,12 +413,86 @@ def _download_sync(
         return mp4
 
     # Fallback: any .mp4 yt-dlp wrote
-    for f in out_dir.glob("*.mp4"):
-        return f
+    with os.scandir(out_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".mp4") and entry.is_file():
+                return Path(entry.path)
 
     return None
 
 
+def _metadata_opts(proxy: str | None) -> dict[str, Any]:
+    """Build yt-dlp options for metadata-only extraction."""
+    opts: dict[str, Any] = {"quiet": True, "no_warnings": True, "ignoreerrors": True}
+    if proxy:
+        opts["proxy"] = proxy
+    return opts
+
+
+@contextlib.contextmanager
+def _pooled_ydl(
+    purpose: str, build_opts: Callable[[str | None], dict[str, Any]]
+) -> Iterator[yt_dlp.YoutubeDL]:
+    """Check out an idle pooled ``YoutubeDL`` for exclusive use.
+
+    Instances are pooled per purpose and proxy setting and returned to the
+    pool on exit, so extractor setup and HTTP connections are paid once per
+    concurrent user rather than once per call.  ``YoutubeDL`` is not
+    thread-safe; each instance is only ever held by one caller at a time.
+    Idle instances are closed by ``close_ydl_pool``.
+
+    Args:
+        purpose: Pool name; instances are only shared within one purpose.
+        build_opts: Builds the yt-dlp options for a new instance from the
+            current proxy URL.
+    """
+    key = (purpose, load_proxy_url())
+    with _YDL_POOL_LOCK:
+        idle = _YDL_POOL.get(key)
+        ydl = idle.pop() if idle else None
+    if ydl is None:
+        ydl = yt_dlp.YoutubeDL(build_opts(key[1]))
+    # Only return the instance on a clean exit: after cancellation a daemon
+    # thread may still be running extract_info on it.
+    yield ydl
+    with _YDL_POOL_LOCK:
+        _YDL_POOL.setdefault(key, []).append(ydl)
+
+
+def close_ydl_pool() -> None:
+    """Close every idle pooled ``YoutubeDL`` and empty the pool.
+
+    Instances checked out at the time are left alone.  Sync calls this when
+    it finishes so pooled HTTP connections do not outlive the run.
+    """
+    with _YDL_POOL_LOCK:
+        idle = [ydl for instances in _YDL_POOL.values() for ydl in instances]
+        _YDL_POOL.clear()
+    for ydl in idle:
+        try:
+            ydl.close()
+        except Exception as exc:
+            logger.debug("Failed to close pooled YoutubeDL: %s", exc)
+
+
+def _extract_metadata_info(url: str) -> dict[str, Any] | None:
+    """Run a metadata-only ``extract_info`` on a pooled ``YoutubeDL``."""
+    with _pooled_ydl("metadata", _metadata_opts) as ydl:
+        return ydl.extract_info(url, download=False)
+
+
+def _info_to_metadata(video_id: str, info: dict[str, Any]) -> dict[str, Any]:
+    """Reduce a yt-dlp info dict to the fields TubeVault stores."""
+    return {
+        "video_id": video_id,
+        "title": info.get("title", ""),
+        "upload_date": _parse_date(info.get("upload_date", "")),
+        "duration_seconds": info.get("duration") or 0,
+        "description": info.get("description", ""),
+        "thumbnail_url": info.get("thumbnail", ""),
+    }
+
+
 async def fetch_video_metadata(video_id: str) -> dict[str, Any] | None:
     """Fetch detailed metadata for a single video (without downloading).
 
@@ -367,27 +503,83 @@ async def fetch_video_metadata(video_id: str) -> dict[str, Any] | None:
         Metadata dict or None on failure.
     """
     url = f"https://www.youtube.com/watch?v={video_id}"
-    opts: dict[str, Any] = {"quiet": True, "no_warnings": True, "ignoreerrors": True}
-    proxy = load_proxy_url()
-    if proxy:
-        opts["proxy"] = proxy
     try:
-        info = await run_in_daemon_thread(_extract_info, url, opts)
+        info = await run_in_daemon_thread(_extract_metadata_info, url)
     except Exception as exc:
         logger.error("Failed to fetch metadata for %s: %s", video_id, exc)
         return None
     if not info:
         return None
-    return {
-        "video_id": video_id,
-        "title": info.get("title", ""),
-        "upload_date": _parse_date(info.get("upload_date", "")),
-        "duration_seconds": info.get("duration") or 0,
-        "description": info.get("description", ""),
-        "thumbnail_url": info.get("thumbnail", ""),
-    }
+    return _info_to_metadata(video_id, info)
 
 
-def _extract_info(url: str, opts: dict[str, Any]) -> dict[str, Any] | None:
-    with yt_dlp.YoutubeDL(opts) as ydl:
-        return ydl.extract_info(url, download=False)
+async def fetch_video_metadata_batch(
+    video_ids: list[str],
+    concurrency: int = 4,
+    result_callback: Callable[[str, dict[str, Any] | None], None] | None = None,
+) -> None:
+    """Fetch metadata for many videos using a fixed pool of yt-dlp instances.
+
+    Each of the *concurrency* workers checks out one pooled ``YoutubeDL``
+    instance and pulls IDs from a shared queue, so extractor setup and HTTP
+    connections are reused across requests instead of being rebuilt per video.
+
+    Args:
+        video_ids: YouTube video IDs to fetch.
+        concurrency: Number of parallel workers.
+        result_callback: Optional callable invoked on the event loop with
+            ``(video_id, metadata)`` as each fetch finishes; *metadata* is
+            None on failure.
+    """
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for vid in video_ids:
+        queue.put_nowait(vid)
+
+    async def _worker() -> None:
+        with _pooled_ydl("metadata", _metadata_opts) as ydl:
+            while True:
+                try:
+                    vid = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                url = f"https://www.youtube.com/watch?v={vid}"
+                meta: dict[str, Any] | None = None
+                try:
+                    info = await run_in_daemon_thread(ydl.extract_info, url, False)
+                    if info:
+                        meta = _info_to_metadata(vid, info)
+                except Exception as exc:
+                    logger.error("Failed to fetch metadata for %s: %s", vid, exc)
+                if result_callback:
+                    try:
+                        result_callback(vid, meta)
+                    except Exception as exc:
+                        logger.debug("Metadata callback error: %s", exc)
+
+    workers = max(1, min(concurrency, len(video_ids)))
+    await asyncio.gather(*[_worker() for _ in range(workers)])
+
+
+async def fetch_video_metadata_many(
+    video_ids: list[str],
+    concurrency: int = 8,
+) -> list[dict[str, Any] | None]:
+    """Fetch metadata for many videos concurrently, returning results in order.
+
+    Convenience wrapper over ``fetch_video_metadata_batch`` for callers that
+    want the results as a list rather than streamed through a callback.
+
+    Args:
+        video_ids: YouTube video IDs to fetch.
+        concurrency: Maximum number of lookups in flight.
+
+    Returns:
+        Metadata dicts aligned with *video_ids*; None where a fetch failed.
+    """
+    results: dict[str, dict[str, Any] | None] = {}
+
+    def _collect(vid: str, meta: dict[str, Any] | None) -> None:
+        results[vid] = meta
+
+    await fetch_video_metadata_batch(list(dict.fromkeys(video_ids)), concurrency, _collect)
+    return [results.get(vid) for vid in video_ids]
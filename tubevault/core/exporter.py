@@ -1,23 +1,30 @@
 """Export video summaries to Markdown files."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from tubevault.core.database import load_library, load_summary
-from tubevault.core.summarizer import generate_master_summary
-from tubevault.utils.helpers import format_duration, format_timestamp
+from tubevault.core.database import (
+    LIBRARY_LOAD_WORKERS,
+    load_library,
+    load_summary,
+    load_summary_markdown,
+    save_summary_markdown,
+)
+from tubevault.core.summarizer import generate_master_summary_mapreduce
+from tubevault.utils.helpers import format_duration, format_timestamp, run_in_daemon_thread
 
 logger = logging.getLogger(__name__)
 
 
-def _video_to_markdown(video: dict[str, Any], summary: dict[str, Any]) -> str:
+def _video_to_markdown(video: dict[str, Any], body: str) -> str:
     """Render a single video entry as Markdown.
 
     Args:
         video: Library video entry dict.
-        summary: Summary dict for the video.
+        body: Rendered summary body from ``_summary_body_markdown``.
 
     Returns:
         Markdown string for this video.
@@ -25,13 +32,25 @@ def _video_to_markdown(video: dict[str, Any], summary: dict[str, Any]) -> str:
     title = video.get("title", video["video_id"])
     upload_date = video.get("upload_date", "")
     duration = format_duration(video.get("duration_seconds", 0))
+    return f"## {title}\n**Date:** {upload_date} | **Duration:** {duration}\n\n{body}"
+
+
+def _summary_body_markdown(summary: dict[str, Any]) -> str:
+    """Render the summary text and key points of a video as Markdown.
+
+    Only depends on the summary itself, so the result can be cached on disk
+    while title and date (which may still be backfilled) are rendered fresh.
+
+    Args:
+        summary: Summary dict for the video.
+
+    Returns:
+        Markdown string for the summary body.
+    """
     summary_text = summary.get("summary_text", "")
     main_points = summary.get("main_points", [])
 
     lines = [
-        f"## {title}",
-        f"**Date:** {upload_date} | **Duration:** {duration}",
-        "",
         summary_text,
         "",
         "### Key Points",
@@ -46,6 +65,50 @@ def _video_to_markdown(video: dict[str, Any], summary: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def cache_summary_markdown(channel_name: str, video_id: str, summary: dict[str, Any]) -> str:
+    """Render a summary body and store it as the video's summary.md.
+
+    Args:
+        channel_name: Channel slug.
+        video_id: YouTube video ID.
+        summary: Summary dict for the video.
+
+    Returns:
+        The rendered Markdown body.
+    """
+    body = _summary_body_markdown(summary)
+    save_summary_markdown(channel_name, video_id, body)
+    return body
+
+
+def _load_summary_body(channel_name: str, video_id: str) -> str | None:
+    """Return the cached summary body, rendering and caching it if needed."""
+    body = load_summary_markdown(channel_name, video_id)
+    if body is None:
+        summary = load_summary(channel_name, video_id)
+        if not summary:
+            return None
+        body = cache_summary_markdown(channel_name, video_id, summary)
+    return body
+
+
+def _load_summary_bodies(channel_name: str, video_ids: list[str]) -> list[str | None]:
+    """Load summary bodies for several videos, overlapping the file reads.
+
+    Args:
+        channel_name: Channel slug.
+        video_ids: Video IDs to load, in output order.
+
+    Returns:
+        Markdown bodies (or None where missing) in the same order as ``video_ids``.
+    """
+    if len(video_ids) <= 2:
+        return [_load_summary_body(channel_name, vid) for vid in video_ids]
+    workers = min(LIBRARY_LOAD_WORKERS, len(video_ids))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda vid: _load_summary_body(channel_name, vid), video_ids))
+
+
 async def export_channel(
     channel_name: str,
     output_path: Path,
@@ -65,27 +128,35 @@ async def export_channel(
         reverse=True,
     )
 
+    videos = [v for v in videos if v.get("has_summary")]
+    bodies = await run_in_daemon_thread(
+        _load_summary_bodies, channel_name, [v["video_id"] for v in videos]
+    )
+
     video_sections: list[str] = []
-    for video in videos:
-        if not video.get("has_summary"):
-            continue
-        summary = load_summary(channel_name, video["video_id"])
-        if not summary:
+    for video, body in zip(videos, bodies):
+        if body is None:
             continue
-        video_sections.append(_video_to_markdown(video, summary))
+        video_sections.append(_video_to_markdown(video, body))
 
     now = datetime.now().strftime("%Y-%m-%d %H:%M")
     header = f"# TubeVault Summary Export: {channel_name}\nGenerated: {now}\n\n---\n"
-    body = "\n\n".join(video_sections)
-    full_content = header + "\n" + body
 
+    master_section = ""
     if include_master_summary and video_sections:
         logger.info("Generating master summary for %s…", channel_name)
-        master = await generate_master_summary(body)
+        master = await generate_master_summary_mapreduce(video_sections)
         if master:
             master_section = f"# Master Summary\n\n{master}\n\n---\n\n"
-            full_content = master_section + full_content
 
+    # Stream the sections out instead of concatenating one large string.
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(full_content, encoding="utf-8")
+    with output_path.open("w", encoding="utf-8") as handle:
+        handle.write(master_section)
+        handle.write(header)
+        handle.write("\n")
+        for index, section in enumerate(video_sections):
+            if index:
+                handle.write("\n\n")
+            handle.write(section)
     logger.info("Exported %d summaries to %s", len(video_sections), output_path)
@@ -1,5 +1,6 @@
 """Generate a temporary HTML video player page and open it in the browser."""
 
+import functools
 import logging
 import os
 import tempfile
@@ -7,7 +8,7 @@ import webbrowser
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 
 from tubevault.core.database import load_summary, video_dir
 from tubevault.utils.helpers import format_timestamp
@@ -16,7 +17,27 @@ logger = logging.getLogger(__name__)
 
 _TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
 
-_TEMP_FILES: list[Path] = []
+_TEMP_FILES: dict[str, Path] = {}
+
+
+@functools.cache
+def _player_template() -> Template:
+    """Return the compiled player template, building it on first use.
+
+    The template ships with the package and never changes at runtime, so one
+    environment with reloading disabled compiles it exactly once per process.
+    The bytecode cache lets later processes skip parsing it at all; with no
+    directory given, Jinja keeps it in a per-user 0700 directory and refuses
+    one owned by another user.  Nothing here runs at import time, so starting
+    the TUI does not pay for it.
+    """
+    env = Environment(
+        loader=FileSystemLoader(str(_TEMPLATE_DIR)),
+        autoescape=True,
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache(),
+    )
+    return env.get_template("player.html")
 
 
 def open_video_player(channel_name: str, video: dict[str, Any]) -> None:
@@ -41,20 +62,25 @@ def open_video_player(channel_name: str, video: dict[str, Any]) -> None:
             }
         )
 
-    env = Environment(loader=FileSystemLoader(str(_TEMPLATE_DIR)), autoescape=True)
-    template = env.get_template("player.html")
-    html = template.render(
+    has_video = video_file.exists()
+    html = _player_template().render(
         title=video.get("title", video_id),
         upload_date=video.get("upload_date", ""),
-        video_uri=video_file.as_uri() if video_file.exists() else "",
+        video_uri=video_file.as_uri() if has_video else "",
         summary_text=summary.get("summary_text", ""),
         main_points=main_points,
-        has_video=video_file.exists(),
+        has_video=has_video,
     )
 
-    tmp = Path(tempfile.mktemp(suffix=".html", prefix="tubevault_player_"))
+    # Reuse one page per video so repeated opens overwrite instead of piling up.
+    tmp = _TEMP_FILES.get(video_id)
+    if tmp is None:
+        with tempfile.NamedTemporaryFile(
+            suffix=".html", prefix="tubevault_player_", delete=False
+        ) as handle:
+            tmp = Path(handle.name)
+        _TEMP_FILES[video_id] = tmp
     tmp.write_text(html, encoding="utf-8")
-    _TEMP_FILES.append(tmp)
 
     webbrowser.open(tmp.as_uri())
     logger.info("Opened player for %s at %s", video_id, tmp)
@@ -62,7 +88,7 @@ def open_video_player(channel_name: str, video: dict[str, Any]) -> None:
 
 def cleanup_temp_files() -> None:
     """Remove all temporary HTML player files created in this session."""
-    for path in _TEMP_FILES:
+    for path in _TEMP_FILES.values():
         try:
             path.unlink(missing_ok=True)
         except OSError as exc:
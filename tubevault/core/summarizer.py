@@ -4,15 +4,30 @@ import asyncio
 import json
 import logging
 import os
+import weakref
 from datetime import datetime, timezone
 from typing import Any
 
 from tubevault.core.transcript import transcript_to_text
+from tubevault.utils.helpers import json_loads
 
 logger = logging.getLogger(__name__)
 
 MODEL = "claude-sonnet-4-20250514"
 
+# Rough budget per master-summary call (~150K tokens at ~4 chars per token).
+MASTER_CHUNK_CHARS = 600_000
+
+# Most master-summary calls of one map step in flight at once; each is a
+# large request, so sending every group together would hit rate limits.
+MASTER_MAP_CONCURRENCY = 3
+
+# Async clients hold connections bound to the loop that opened them, so they
+# are cached per event loop and dropped along with it.
+_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
 SYSTEM_PROMPT = """\
 You are a content analyst. Given a video transcript with timestamps, produce a focused summary of the video's substantive content.
 
@@ -32,16 +47,53 @@ Respond in JSON format:
 }"""
 
 
+def _cached_system(text: str) -> list[dict[str, Any]]:
+    """Wrap a system prompt as a content block marked for prompt caching.
+
+    The system prompt is identical across every call of a sync, so marking it
+    lets the API serve that prefix from its cache instead of reprocessing it.
+
+    Args:
+        text: System prompt text.
+
+    Returns:
+        System content blocks for ``messages.create``.
+    """
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+def _client_for_key(api_key: str) -> Any:
+    """Return the async Anthropic client for an API key on the running loop.
+
+    The client owns an HTTP connection pool, so reusing it avoids a fresh
+    TLS handshake on every call.
+
+    Args:
+        api_key: Anthropic API key.
+
+    Returns:
+        anthropic.AsyncAnthropic client instance.
+    """
+    clients = _CLIENTS.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(api_key)
+    if client is None:
+        import anthropic
+
+        client = clients[api_key] = anthropic.AsyncAnthropic(api_key=api_key)
+    return client
+
+
 def _get_client() -> Any:
-    """Create and return an Anthropic client using the configured API key env var.
+    """Return the async Anthropic client for the configured API key env var.
+
+    Must be called from within a running event loop.
 
     Returns:
-        anthropic.Anthropic client instance.
+        anthropic.AsyncAnthropic client instance.
 
     Raises:
         RuntimeError: If the API key environment variable is not set.
     """
-    import anthropic
     from tubevault.core.config import load_config
 
     config = load_config()
@@ -51,7 +103,7 @@ def _get_client() -> Any:
         raise RuntimeError(
             f"Anthropic API key not found. Set the {env_var!r} environment variable."
         )
-    return anthropic.Anthropic(api_key=api_key)
+    return _client_for_key(api_key)
 
 
 async def generate_summary(
@@ -69,30 +121,126 @@ async def generate_summary(
     Returns:
         Summary dict matching summary.json schema, or None on failure.
     """
-    transcript_text = transcript_to_text(segments)
-    if not transcript_text.strip():
-        logger.warning("Empty transcript for %s — skipping summary", video_id)
+    user_message = _build_user_message(video_id, segments, title)
+    if user_message is None:
         return None
 
-    user_message = f"Video title: {title}\n\nTranscript:\n{transcript_text}"
-
     try:
-        result = await asyncio.get_running_loop().run_in_executor(
-            None, _call_api, user_message
-        )
-        return {
-            "video_id": video_id,
-            "generated_date": datetime.now(timezone.utc).isoformat(),
-            "model_used": MODEL,
-            **result,
-        }
+        result = await _call_api(user_message)
+        return _summary_record(video_id, result)
     except Exception as exc:
         logger.error("Summary generation failed for %s: %s", video_id, exc)
         return None
 
 
-def _call_api(user_message: str) -> dict[str, Any]:
-    """Make the synchronous Anthropic API call.
+async def submit_summary_batch(
+    items: list[tuple[str, list[dict[str, Any]], str]],
+) -> str | None:
+    """Submit summaries for many videos through the Message Batches API.
+
+    Batched requests are billed at a discount and avoid one round trip per
+    video, but a batch can take up to a day to end, so this only submits it;
+    results are picked up later with ``collect_summary_batch``.
+
+    Args:
+        items: ``(video_id, segments, title)`` tuples, one per video.
+
+    Returns:
+        The batch id, or None if nothing was submitted.
+    """
+    requests = []
+    for video_id, segments, title in items:
+        user_message = _build_user_message(video_id, segments, title)
+        if user_message is None:
+            continue
+        requests.append({
+            "custom_id": video_id,
+            "params": {
+                "model": MODEL,
+                "max_tokens": 4096,
+                "system": _cached_system(SYSTEM_PROMPT),
+                "messages": [{"role": "user", "content": user_message}],
+            },
+        })
+    if not requests:
+        return None
+
+    try:
+        batch = await _get_client().messages.batches.create(requests=requests)
+    except Exception as exc:
+        logger.error("Batch summary submission failed: %s", exc)
+        return None
+    logger.info("Submitted summary batch %s (%d requests)", batch.id, len(requests))
+    return batch.id
+
+
+async def collect_summary_batch(batch_id: str) -> dict[str, dict[str, Any] | None] | None:
+    """Fetch the results of a batch from ``submit_summary_batch`` if it has ended.
+
+    Checks the batch status once and never waits for it.
+
+    Args:
+        batch_id: Id returned by ``submit_summary_batch``.
+
+    Returns:
+        Mapping of video_id to summary dict (None where that video failed),
+        or None while the batch is still processing.
+
+    Raises:
+        RuntimeError: If the API key environment variable is not set.
+        anthropic.APIError: If the batch status or results cannot be fetched.
+    """
+    client = _get_client()
+    batch = await client.messages.batches.retrieve(batch_id)
+    if batch.processing_status != "ended":
+        return None
+
+    results: dict[str, dict[str, Any] | None] = {}
+    async for entry in await client.messages.batches.results(batch_id):
+        video_id = entry.custom_id
+        results[video_id] = None
+        if entry.result.type != "succeeded":
+            logger.error("Batched summary %s for %s", entry.result.type, video_id)
+            continue
+        try:
+            parsed = _parse_summary_response(entry.result.message.content[0].text)
+        except RuntimeError as exc:
+            logger.error("Summary generation failed for %s: %s", video_id, exc)
+            continue
+        results[video_id] = _summary_record(video_id, parsed)
+    return results
+
+
+def _build_user_message(video_id: str, segments: list[dict[str, Any]], title: str) -> str | None:
+    """Build the summary prompt for a transcript.
+
+    Args:
+        video_id: YouTube video ID (for logging).
+        segments: Transcript segments with ``text`` and ``start`` keys.
+        title: Video title.
+
+    Returns:
+        The user turn content, or None if the transcript is empty.
+    """
+    transcript_text = transcript_to_text(segments)
+    if not transcript_text.strip():
+        logger.warning("Empty transcript for %s — skipping summary", video_id)
+        return None
+    return f"Video title: {title}\n\nTranscript:\n{transcript_text}"
+
+
+def _summary_record(video_id: str, parsed: dict[str, Any]) -> dict[str, Any]:
+    """Wrap a parsed API response in the summary.json envelope."""
+    return {
+        "video_id": video_id,
+        "generated_date": datetime.now(timezone.utc).isoformat(),
+        "model_used": MODEL,
+        **parsed,
+    }
+
+
+async def _call_api(user_message: str) -> dict[str, Any]:
+    """Make the Anthropic API call.
 
     Args:
         user_message: The user turn content.
@@ -104,21 +252,38 @@ def _call_api(user_message: str) -> dict[str, Any]:
         RuntimeError: On API or parsing error.
     """
     client = _get_client()
-    response = client.messages.create(
+    response = await client.messages.create(
         model=MODEL,
         max_tokens=4096,
-        system=SYSTEM_PROMPT,
+        system=_cached_system(SYSTEM_PROMPT),
         messages=[{"role": "user", "content": user_message}],
     )
-    raw = response.content[0].text.strip()
+    return _parse_summary_response(response.content[0].text)
+
+
+def _parse_summary_response(text: str) -> dict[str, Any]:
+    """Parse a model reply into a summary dict.
+
+    Args:
+        text: Raw text of the model's reply.
 
-    # Strip markdown code fences if present
+    Returns:
+        Parsed summary dict with ``summary_text`` and ``main_points``.
+
+    Raises:
+        RuntimeError: If the reply is not the expected JSON structure.
+    """
+    raw = text.strip()
+
+    # Strip markdown code fences if present, without splitting every line
     if raw.startswith("```"):
-        lines = raw.splitlines()
-        raw = "\n".join(lines[1:-1] if lines[-1].strip() == "```" else lines[1:])
+        raw = raw.partition("\n")[2]
+        body, _, last = raw.rpartition("\n")
+        if last.strip() == "```":
+            raw = body
 
     try:
-        parsed = json.loads(raw)
+        parsed = json_loads(raw)
     except json.JSONDecodeError as exc:
         raise RuntimeError(f"Failed to parse API response as JSON: {exc}\nRaw: {raw[:500]}") from exc
 
@@ -128,6 +293,30 @@ def _call_api(user_message: str) -> dict[str, Any]:
     return parsed
 
 
+MASTER_SYSTEM_PROMPT = """\
+You are a research synthesizer. Below are summaries of multiple videos from the same YouTube channel, ordered from newest to oldest.
+
+Produce a master summary that:
+1. Synthesizes the key themes and information across all videos
+2. Organizes findings by topic/theme, not chronologically
+3. Where information is contradictory between videos, note the contradiction and give higher weight to more recent videos (listed first)
+4. Ignore any residual marketing or promotional content
+5. Highlight any evolution of the creator's views or recommendations over time
+
+Output clean, well-structured Markdown."""
+
+MASTER_REDUCE_PROMPT = """\
+You are a research synthesizer. Below are partial syntheses of one YouTube channel's videos. Each partial already summarizes a consecutive span of videos; the partials are ordered from the newest span to the oldest.
+
+Merge them into one master summary that:
+1. Combines the themes of all partials, merging overlapping topics instead of repeating them
+2. Organizes findings by topic/theme, not by partial or chronologically
+3. Where partials contradict each other, note the contradiction and give higher weight to the partials covering more recent videos (listed first)
+4. Preserves any evolution of the creator's views or recommendations over time that the partials describe
+
+Output clean, well-structured Markdown."""
+
+
 async def generate_master_summary(compiled_markdown: str) -> str | None:
     """Generate a master synthesis summary from compiled per-video summaries.
 
@@ -137,34 +326,89 @@ async def generate_master_summary(compiled_markdown: str) -> str | None:
     Returns:
         Master summary markdown text, or None on failure.
     """
-    system = """\
-You are a research synthesizer. Below are summaries of multiple videos from the same YouTube channel, ordered from newest to oldest.
+    return await _synthesize(MASTER_SYSTEM_PROMPT, compiled_markdown)
 
-Produce a master summary that:
-1. Synthesizes the key themes and information across all videos
-2. Organizes findings by topic/theme, not chronologically
-3. Where information is contradictory between videos, note the contradiction and give higher weight to more recent videos (listed first)
-4. Ignore any residual marketing or promotional content
-5. Highlight any evolution of the creator's views or recommendations over time
 
-Output clean, well-structured Markdown."""
+async def generate_master_summary_mapreduce(sections: list[str]) -> str | None:
+    """Generate a master summary for any number of per-video sections.
+
+    Sections are packed in order into groups that fit one call's context.
+    Each group is synthesized (at most ``MASTER_MAP_CONCURRENCY`` at a time)
+    and the partial syntheses are merged with ``MASTER_REDUCE_PROMPT`` the
+    same way until a single summary remains.
+
+    Args:
+        sections: Markdown sections for each video, newest first.
+
+    Returns:
+        Master summary markdown text, or None on failure.
+    """
+    return await _synthesize_sections(sections, MASTER_SYSTEM_PROMPT)
 
+
+async def _synthesize_sections(sections: list[str], system: str) -> str | None:
+    """Map-reduce *sections* with *system* until one synthesis remains."""
+    groups = _group_sections(sections, MASTER_CHUNK_CHARS)
+    if not groups:
+        return None
+    if len(groups) == 1:
+        return await _synthesize(system, groups[0])
+
+    logger.info("Master summary: reducing %d groups", len(groups))
+    limit = asyncio.Semaphore(MASTER_MAP_CONCURRENCY)
+
+    async def _synthesize_group(group: str) -> str | None:
+        async with limit:
+            return await _synthesize(system, group)
+
+    partials = await asyncio.gather(*[_synthesize_group(g) for g in groups])
+    partials = [p for p in partials if p]
+    if not partials:
+        return None
+    return await _synthesize_sections(partials, MASTER_REDUCE_PROMPT)
+
+
+async def _synthesize(system: str, content: str) -> str | None:
+    """Run one master-summary call, logging and returning None on failure."""
     try:
-        result = await asyncio.get_running_loop().run_in_executor(
-            None, _call_master_api, system, compiled_markdown
-        )
-        return result
+        return await _call_master_api(system, content)
     except Exception as exc:
         logger.error("Master summary generation failed: %s", exc)
         return None
 
 
-def _call_master_api(system: str, content: str) -> str:
+def _group_sections(sections: list[str], max_chars: int) -> list[str]:
+    """Join consecutive sections into groups of at most ``max_chars``.
+
+    A single section longer than the limit becomes a group of its own.
+
+    Args:
+        sections: Markdown sections in order.
+        max_chars: Character budget per group.
+
+    Returns:
+        Joined group strings, preserving section order.
+    """
+    groups: list[str] = []
+    current: list[str] = []
+    size = 0
+    for section in sections:
+        if current and size + len(section) > max_chars:
+            groups.append("\n\n".join(current))
+            current, size = [], 0
+        current.append(section)
+        size += len(section) + 2
+    if current:
+        groups.append("\n\n".join(current))
+    return groups
+
+
+async def _call_master_api(system: str, content: str) -> str:
     client = _get_client()
-    response = client.messages.create(
+    response = await client.messages.create(
         model=MODEL,
         max_tokens=8192,
-        system=system,
+        system=_cached_system(system),
         messages=[{"role": "user", "content": content}],
     )
     return response.content[0].text.strip()
@@ -1,23 +1,41 @@
 """Orchestrator: sync all channels (download + transcript + AI summary)."""
 
 import asyncio
+import contextlib
 import logging
+import math
+import random
+import time
 from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 from tubevault.core.config import QUALITY_MAP, load_config
 from tubevault.core.database import (
+    LibraryWriter,
     batch_update_upload_dates,
+    clear_summary_batch,
     load_library,
+    load_summary_batch,
+    load_transcript,
     mark_library_synced,
     save_summary,
+    save_summary_batch,
     save_transcript,
     upsert_video,
+    upsert_videos_bulk,
     video_dir,
 )
-from tubevault.core.downloader import BotCheckError, MembersOnlyError, download_video, fetch_channel_videos
-from tubevault.core.summarizer import generate_summary
+from tubevault.core.downloader import (
+    BotCheckError,
+    MembersOnlyError,
+    close_ydl_pool,
+    download_video,
+    fetch_channel_videos,
+)
+from tubevault.core.exporter import cache_summary_markdown
+from tubevault.core.summarizer import collect_summary_batch, generate_summary, submit_summary_batch
 from tubevault.core.transcript import fetch_transcript
 from tubevault.utils.helpers import load_proxy_url
 
@@ -33,8 +51,29 @@ PROXY_CONCURRENCY = 4
 # challenge.  Each retry uses a fresh proxy connection (new IP).
 MAX_BOT_CHECK_RETRIES = 5
 
+# Retries (with jittered exponential backoff) for a failed channel listing.
+FETCH_MAX_RETRIES = 2
+FETCH_RETRY_BASE_DELAY = 5.0
+FETCH_RETRY_JITTER = 2.0
+
+# How long a video whose transcript came back unavailable is left out of
+# backfills before it is tried again (captions are sometimes added later).
+TRANSCRIPT_RECHECK_INTERVAL = timedelta(days=1)
+
+# Minimum seconds between progress callbacks (~30 Hz); see _coalesced_callback.
+PROGRESS_EMIT_INTERVAL = 1 / 30
+
+# With "batch_summaries" enabled in config.json, backfills with at least this
+# many videos that only lack a summary submit them as one Message Batch.  It
+# is cheaper, but results can take up to a day, so a later sync collects them.
+SUMMARY_BATCH_MIN = 10
+
+# A pending batch whose status still cannot be fetched after this long is
+# abandoned and its videos are summarized one by one again.
+SUMMARY_BATCH_MAX_AGE = timedelta(days=2)
 
-@dataclass
+
+@dataclass(slots=True)
 class VideoProgress:
     """Progress state for a single video being synced."""
 
@@ -50,7 +89,7 @@ class VideoProgress:
     summary: str = "pending"     # pending | in_progress | done | skipped | error
 
 
-@dataclass
+@dataclass(slots=True)
 class ChannelSyncProgress:
     """Progress state for a channel sync operation."""
 
@@ -66,11 +105,65 @@ class ChannelSyncProgress:
     retry_message: str = ""    # human-readable retry status message
 
 
+@dataclass(slots=True)
+class _LibraryScan:
+    """What a sync needs to know about a channel's existing library."""
+
+    existing_ids: set[str] = field(default_factory=set)
+    stop_at_ids: set[str] = field(default_factory=set)   # fully synced videos
+    has_any_date: bool = False
+    backfill: list[dict[str, Any]] = field(default_factory=list)
+
+
 SyncCallback = Callable[[ChannelSyncProgress], None]
 LogCallback = Callable[[Any], None]
 SlotLogCallback = Callable[[int, Any], None]
 
 
+class _DownloadGate:
+    """Space downloads at least ``delay`` seconds apart (no-proxy mode).
+
+    The cooldown runs from the end of the previous download to the start of
+    the next one, so transcript and summary work in between counts towards it
+    instead of being followed by a fixed pause.
+    """
+
+    def __init__(self, delay: float) -> None:
+        self._delay = delay
+        self._lock = asyncio.Lock()
+        self._last_finished = -math.inf
+
+    @contextlib.asynccontextmanager
+    async def slot(
+        self, prog: ChannelSyncProgress, callback: SyncCallback | None,
+    ) -> AsyncIterator[None]:
+        """Wait out any remaining cooldown, then hold the gate for one download."""
+        async with self._lock:
+            wait = self._last_finished + self._delay - time.monotonic()
+            if wait > 0:
+                ticker = asyncio.create_task(_countdown(prog, wait, callback))
+                try:
+                    await asyncio.sleep(wait)
+                finally:
+                    ticker.cancel()
+                    prog.retry_countdown = 0
+                    prog.retry_message = ""
+                    _emit(callback, prog)
+            try:
+                yield
+            finally:
+                self._last_finished = time.monotonic()
+
+
+async def _countdown(prog: ChannelSyncProgress, seconds: float, callback: SyncCallback | None) -> None:
+    """Tick the retry countdown shown in the UI once per second."""
+    for remaining in range(math.ceil(seconds), 0, -1):
+        prog.retry_countdown = remaining
+        prog.retry_message = f"⏸ Next request in {remaining}s"
+        _emit(callback, prog)
+        await asyncio.sleep(1)
+
+
 async def sync_channel(
     channel_name: str,
     channel_url: str,
@@ -91,6 +184,7 @@ async def sync_channel(
         log_callback: Optional callback for channel-level log lines (routed to slot 0).
         slot_log_callback: Optional callback for per-slot log lines; receives (slot_idx, msg).
     """
+    progress_callback = _coalesced_callback(progress_callback)
     # Always allocate 4 UI slots so the quadrant display is stable.
     NUM_SLOTS = 4
     prog = ChannelSyncProgress(channel_name=channel_name, slots=[None] * NUM_SLOTS)
@@ -104,19 +198,14 @@ async def sync_channel(
     concurrency = PROXY_CONCURRENCY if proxy else 1
     prog.slot_count = concurrency
 
-    library = load_library(channel_name)
-    existing_ids = {v["video_id"] for v in library.get("videos", [])}
-    stop_at_ids = {
-        v["video_id"] for v in library.get("videos", [])
-        if v.get("has_video") and v.get("has_transcript") and v.get("has_summary")
-    }
+    scan = _scan_library(load_library(channel_name))
+    existing_ids = scan.existing_ids
 
     # If no library entry has an upload_date yet, fetch the full channel
     # listing (disabling the early-stop optimisation) so every video gets its
     # date populated in a single pass.
-    has_any_date = any(v.get("upload_date") for v in library.get("videos", []))
-    effective_stop_at_ids = stop_at_ids if has_any_date else None
-    if not has_any_date and existing_ids:
+    effective_stop_at_ids = scan.stop_at_ids if scan.has_any_date else None
+    if not scan.has_any_date and existing_ids:
         _log(log_callback, "No publish dates in library — fetching full listing to populate dates…")
 
     try:
@@ -139,11 +228,11 @@ async def sync_channel(
         batch_update_upload_dates(channel_name, remote_dates)
 
     new_videos = [v for v in remote_videos if v["video_id"] not in existing_ids]
-    backfill_videos = [
-        v for v in library.get("videos", [])
-        if (not v.get("has_transcript") or not v.get("has_summary"))
-        and not v.get("members_only")
-    ]
+    backfill_videos = scan.backfill
+
+    batched_ids = await _advance_summary_batch(channel_name, backfill_videos, log_callback)
+    if batched_ids:
+        backfill_videos = [v for v in backfill_videos if v["video_id"] not in batched_ids]
 
     to_process = new_videos + backfill_videos
     prog.total = len(to_process)
@@ -159,27 +248,32 @@ async def sync_channel(
         _emit(progress_callback, prog)
         return
 
-    for v in new_videos:
-        upsert_video(channel_name, v)
-
-    semaphore = asyncio.Semaphore(concurrency)
-    available_slots: list[int] = list(range(concurrency))
+    upsert_videos_bulk(channel_name, new_videos)
 
-    async def _process_one(video: dict[str, Any]) -> None:
-        async with semaphore:
-            slot_idx = available_slots.pop(0)
+    # A fixed pool of workers drains the queue; each worker owns one UI slot,
+    # so only `concurrency` videos are ever in flight.
+    video_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+    for video in to_process:
+        video_queue.put_nowait(video)
+    download_gate = None if proxy else _DownloadGate(INTER_REQUEST_DELAY)
 
-            def _slot_log(msg: Any) -> None:
-                if slot_log_callback:
-                    try:
-                        slot_log_callback(slot_idx, msg)
-                    except Exception:
-                        pass
+    async def _worker(slot_idx: int) -> None:
+        def _slot_log(msg: Any) -> None:
+            if slot_log_callback:
+                try:
+                    slot_log_callback(slot_idx, msg)
+                except Exception:
+                    pass
 
+        while True:
+            try:
+                video = video_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
             try:
                 await _process_video(
                     channel_name, video, quality, prog, slot_idx,
-                    progress_callback, _slot_log,
+                    progress_callback, _slot_log, download_gate, writer.upsert,
                 )
             except Exception as exc:
                 msg = f"Failed to process {video.get('video_id')}: {exc}"
@@ -187,11 +281,20 @@ async def sync_channel(
                 _slot_log(f"ERROR: {msg}")
             finally:
                 prog.slots[slot_idx] = None
-                available_slots.append(slot_idx)
+                # Persist the finished video's flags before taking the next one.
+                try:
+                    writer.flush()
+                except Exception as exc:
+                    logger.error("Failed to save library updates: %s", exc)
             prog.completed += 1
             _emit(progress_callback, prog)
 
-    await asyncio.gather(*[_process_one(v) for v in to_process])
+    tasks = [_worker(idx) for idx in range(min(concurrency, len(to_process)))]
+    try:
+        with LibraryWriter() as writer:
+            await asyncio.gather(*tasks)
+    finally:
+        close_ydl_pool()
 
     mark_library_synced(channel_name)
     prog.done = True
@@ -201,6 +304,59 @@ async def sync_channel(
     logger.info("Channel %s sync complete.", channel_name)
 
 
+def _scan_library(library: dict[str, Any]) -> _LibraryScan:
+    """Collect id sets, date presence and backfill work in one pass.
+
+    Args:
+        library: Merged library dict from ``load_library``.
+
+    Returns:
+        The scan result for the sync.
+    """
+    scan = _LibraryScan()
+    now = datetime.now(timezone.utc)
+    for v in library.get("videos", []):
+        video_id = v["video_id"]
+        scan.existing_ids.add(video_id)
+        if v.get("has_video") and v.get("has_transcript") and v.get("has_summary"):
+            scan.stop_at_ids.add(video_id)
+        if not scan.has_any_date and v.get("upload_date"):
+            scan.has_any_date = True
+        if _needs_backfill(v, now):
+            scan.backfill.append(v)
+    return scan
+
+
+def _needs_backfill(video: dict[str, Any], now: datetime) -> bool:
+    """Return True if an existing library entry still has sync work to do.
+
+    Downloaded videos missing a transcript are skipped for
+    ``TRANSCRIPT_RECHECK_INTERVAL`` after a fetch found none, so captionless
+    videos are not re-fetched on every sync.  A video whose download failed
+    is always queued so the download is retried.
+
+    Args:
+        video: Library video entry dict.
+        now: Current UTC time.
+
+    Returns:
+        Whether the video should be queued for processing.
+    """
+    if video.get("members_only"):
+        return False
+    if video.get("has_transcript"):
+        return not video.get("has_summary")
+    if not video.get("has_video"):
+        return True
+    checked = video.get("transcript_checked")
+    if not checked:
+        return True
+    try:
+        return now - datetime.fromisoformat(checked) >= TRANSCRIPT_RECHECK_INTERVAL
+    except (TypeError, ValueError):
+        return True
+
+
 async def _process_video(
     channel_name: str,
     video: dict[str, Any],
@@ -209,64 +365,74 @@ async def _process_video(
     slot_idx: int,
     callback: SyncCallback | None,
     log_callback: LogCallback | None,
+    download_gate: _DownloadGate | None = None,
+    upsert: Callable[[str, dict[str, Any]], None] = upsert_video,
 ) -> None:
-    """Process a single video: download, transcript, summary."""
+    """Process a single video: download, transcript, summary.
+
+    ``download_gate`` throttles downloads when no proxy is configured.
+    Library updates go through ``upsert`` (e.g. ``LibraryWriter.upsert``).
+    """
     video_id = video["video_id"]
     title = video.get("title", video_id)
     vp = VideoProgress(video_id=video_id, title=title, channel_name=channel_name, quality=quality)
     prog.slots[slot_idx] = vp
     _emit(callback, prog)
 
+    # With a proxy, download and transcript run concurrently; without one
+    # every request comes from the same IP, so they stay sequential behind
+    # the download gate's pacing.  The summary always waits for the transcript.
+    segments: list[dict[str, Any]] | None = None
+    members_only = False
+    stages: list[asyncio.Task] = []
+
+    def _mark_members_only() -> None:
+        nonlocal members_only
+        if not members_only:
+            members_only = True
+            _log(log_callback, f"Members-only video: {video_id} — skipping permanently")
+            upsert(channel_name, {"video_id": video_id, "members_only": True})
+            current = asyncio.current_task()
+            for stage in stages:
+                if stage is not current:
+                    stage.cancel()
+
     # --- Download ---
-    if not video.get("has_video"):
+    async def _download_stage() -> None:
         _log(log_callback, f"--- Downloading: {title} ({video_id}) ---")
-        using_proxy = bool(load_proxy_url())
         mp4_path = None
 
-        for _attempt in range(MAX_BOT_CHECK_RETRIES + 1):
-            try:
-                mp4_path = await download_video(
-                    channel_name,
-                    video_id,
-                    quality=quality,
-                    progress_callback=lambda p, d, t: _update_download(vp, p, d, t, prog, callback),
-                    log_callback=log_callback,
-                )
-                if mp4_path is None:
-                    _log(log_callback, f"Download returned no file for {video_id}")
-                break
-            except MembersOnlyError:
-                _log(log_callback, f"Members-only video: {video_id} — skipping permanently")
-                upsert_video(channel_name, {"video_id": video_id, "members_only": True})
-                vp.download = -1.0
-                vp.transcript = "skipped"
-                vp.summary = "skipped"
-                _emit(callback, prog)
-                return
-            except BotCheckError:
-                if _attempt < MAX_BOT_CHECK_RETRIES:
-                    _log(log_callback, f"Bot check — retrying download with new IP ({_attempt + 1}/{MAX_BOT_CHECK_RETRIES})…")
-                else:
-                    _log(log_callback, f"Bot check: gave up download after {MAX_BOT_CHECK_RETRIES} retries for {video_id}")
+        gate = download_gate.slot(prog, callback) if download_gate else contextlib.nullcontext()
+        async with gate:
+            for _attempt in range(MAX_BOT_CHECK_RETRIES + 1):
+                try:
+                    mp4_path = await download_video(
+                        channel_name,
+                        video_id,
+                        quality=quality,
+                        progress_callback=lambda p, d, t: _update_download(vp, p, d, t, prog, callback),
+                        log_callback=log_callback,
+                    )
+                    if mp4_path is None:
+                        _log(log_callback, f"Download returned no file for {video_id}")
+                    break
+                except MembersOnlyError:
+                    _mark_members_only()
+                    vp.download = -1.0
+                    return
+                except BotCheckError:
+                    if _attempt < MAX_BOT_CHECK_RETRIES:
+                        _log(log_callback, f"Bot check — retrying download with new IP ({_attempt + 1}/{MAX_BOT_CHECK_RETRIES})…")
+                    else:
+                        _log(log_callback, f"Bot check: gave up download after {MAX_BOT_CHECK_RETRIES} retries for {video_id}")
+                        break
+                except Exception as exc:
+                    _log(log_callback, f"Download error for {video_id}: {exc}")
                     break
-            except Exception as exc:
-                _log(log_callback, f"Download error for {video_id}: {exc}")
-                break
-
-        # Pause between requests when not using a proxy.
-        if not using_proxy:
-            for remaining in range(INTER_REQUEST_DELAY, 0, -1):
-                prog.retry_countdown = remaining
-                prog.retry_message = f"⏸ Next request in {remaining}s"
-                _emit(callback, prog)
-                await asyncio.sleep(1)
-            prog.retry_countdown = 0
-            prog.retry_message = ""
-            _emit(callback, prog)
 
         if mp4_path:
             size_mb = mp4_path.stat().st_size / (1024 * 1024)
-            upsert_video(channel_name, {
+            upsert(channel_name, {
                 "video_id": video_id,
                 "has_video": True,
                 "file_size_mb": round(size_mb, 2),
@@ -277,25 +443,19 @@ async def _process_video(
             vp.download = -1.0
             _log(log_callback, f"Download failed for {video_id}")
         _emit(callback, prog)
-    else:
-        vp.download = 1.0
 
     # --- Transcript ---
-    if not video.get("has_transcript"):
+    async def _transcript_stage() -> None:
+        nonlocal segments
         _log(log_callback, f"Fetching transcript for {video_id}…")
         vp.transcript = "in_progress"
         _emit(callback, prog)
-        segments = None
         for _attempt in range(MAX_BOT_CHECK_RETRIES + 1):
             try:
                 segments = await fetch_transcript(channel_name, video_id, log_callback=log_callback)
                 break
             except MembersOnlyError:
-                _log(log_callback, f"Members-only video: {video_id} — skipping permanently")
-                upsert_video(channel_name, {"video_id": video_id, "members_only": True})
-                vp.transcript = "skipped"
-                vp.summary = "skipped"
-                _emit(callback, prog)
+                _mark_members_only()
                 return
             except BotCheckError:
                 if _attempt < MAX_BOT_CHECK_RETRIES:
@@ -303,16 +463,50 @@ async def _process_video(
                 else:
                     _log(log_callback, f"Bot check: gave up transcript after {MAX_BOT_CHECK_RETRIES} retries for {video_id}")
                     break
+        if members_only:
+            return
         if segments:
             save_transcript(channel_name, video_id, segments)
-            upsert_video(channel_name, {"video_id": video_id, "has_transcript": True})
+            upsert(channel_name, {"video_id": video_id, "has_transcript": True})
             vp.transcript = "done"
         else:
-            upsert_video(channel_name, {"video_id": video_id, "has_transcript": False})
+            upsert(channel_name, {
+                "video_id": video_id,
+                "has_transcript": False,
+                "transcript_checked": datetime.now(timezone.utc).isoformat(),
+            })
             vp.transcript = "skipped"
         _emit(callback, prog)
+
+    pending: list[Callable[[], Awaitable[None]]] = []
+    if not video.get("has_video"):
+        pending.append(_download_stage)
+    else:
+        vp.download = 1.0
+    if not video.get("has_transcript"):
+        pending.append(_transcript_stage)
     else:
         vp.transcript = "done"
+    if download_gate is not None:
+        for run_stage in pending:
+            if members_only:
+                break
+            await run_stage()
+    else:
+        stages.extend(asyncio.create_task(run_stage()) for run_stage in pending)
+        # A stage cancelled by _mark_members_only reports CancelledError,
+        # which is not an Exception and is dropped here.
+        for result in await asyncio.gather(*stages, return_exceptions=True):
+            if isinstance(result, Exception):
+                raise result
+
+    if members_only:
+        if vp.download < 1.0:
+            vp.download = -1.0
+        vp.transcript = "skipped"
+        vp.summary = "skipped"
+        _emit(callback, prog)
+        return
 
     # --- Summary ---
     if not video.get("has_summary") and vp.transcript == "done":
@@ -320,17 +514,19 @@ async def _process_video(
         vp.summary = "in_progress"
         _emit(callback, prog)
 
-        from tubevault.core.database import load_transcript as _load_transcript
-        segments = _load_transcript(channel_name, video_id)
+        # A transcript fetched above is used as-is rather than re-read from disk.
+        if segments is None:
+            segments = load_transcript(channel_name, video_id)
         if segments:
             summary = await generate_summary(video_id, segments, title=title)
             if summary:
                 save_summary(channel_name, video_id, summary)
-                upsert_video(channel_name, {"video_id": video_id, "has_summary": True})
+                cache_summary_markdown(channel_name, video_id, summary)
+                upsert(channel_name, {"video_id": video_id, "has_summary": True})
                 vp.summary = "done"
                 _log(log_callback, f"Summary generated for {video_id}")
             else:
-                upsert_video(channel_name, {"video_id": video_id, "has_summary": False})
+                upsert(channel_name, {"video_id": video_id, "has_summary": False})
                 vp.summary = "error"
                 _log(log_callback, f"Summary generation failed for {video_id}")
         else:
@@ -342,6 +538,94 @@ async def _process_video(
         vp.summary = "done"
 
 
+async def _advance_summary_batch(
+    channel_name: str,
+    backfill: list[dict[str, Any]],
+    log_callback: LogCallback | None,
+) -> set[str]:
+    """Move the channel's Message Batch summaries forward without waiting.
+
+    A batch submitted by an earlier sync is collected if it has ended; while
+    it is still processing, its videos are left alone.  With no batch pending
+    and ``batch_summaries`` enabled, backfills that only lack a summary are
+    submitted as a new batch once there are at least ``SUMMARY_BATCH_MIN``.
+
+    Args:
+        channel_name: Channel slug.
+        backfill: Backfill candidates from ``_scan_library``.
+        log_callback: Optional callback for status lines.
+
+    Returns:
+        Ids of videos a batch handled or still owns; the caller must not
+        summarize them this sync.
+    """
+    record = load_summary_batch(channel_name)
+    if record:
+        try:
+            batch_id = record["batch_id"]
+            batch_ids = set(record.get("video_ids", []))
+            age = datetime.now(timezone.utc) - datetime.fromisoformat(record["submitted"])
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.error("Discarding malformed summary batch record for %s: %s", channel_name, exc)
+            _log(log_callback, f"ERROR: discarding malformed summary_batch.json: {exc}")
+            clear_summary_batch(channel_name)
+            return set()
+        try:
+            summaries = await collect_summary_batch(batch_id)
+        except Exception as exc:
+            if age < SUMMARY_BATCH_MAX_AGE:
+                logger.warning("Could not check summary batch for %s: %s", channel_name, exc)
+                _log(log_callback, f"Could not check summary batch ({exc}); will retry next sync")
+                return batch_ids
+            logger.error("Abandoning summary batch for %s: %s", channel_name, exc)
+            _log(log_callback, f"ERROR: abandoning summary batch: {exc}")
+            clear_summary_batch(channel_name)
+            return set()
+        if summaries is None:
+            _log(log_callback, f"Summary batch for {len(batch_ids)} videos is still processing")
+            return batch_ids
+
+        updates = []
+        for video_id in batch_ids:
+            summary = summaries.get(video_id)
+            if summary:
+                save_summary(channel_name, video_id, summary)
+                cache_summary_markdown(channel_name, video_id, summary)
+            updates.append({"video_id": video_id, "has_summary": bool(summary)})
+        upsert_videos_bulk(channel_name, updates)
+        clear_summary_batch(channel_name)
+        done = sum(1 for update in updates if update["has_summary"])
+        _log(log_callback, f"Batch summaries collected: {done}/{len(batch_ids)}")
+        return batch_ids
+
+    if not load_config().get("batch_summaries", False):
+        return set()
+    summary_only = [
+        v for v in backfill
+        if v.get("has_video") and v.get("has_transcript") and not v.get("has_summary")
+    ]
+    if len(summary_only) < SUMMARY_BATCH_MIN:
+        return set()
+
+    items = []
+    for video in summary_only:
+        video_id = video["video_id"]
+        segments = load_transcript(channel_name, video_id)
+        if segments:
+            items.append((video_id, segments, video.get("title", video_id)))
+    batch_id = await submit_summary_batch(items) if items else None
+    if batch_id is None:
+        return set()
+    batch_ids = {video_id for video_id, _, _ in items}
+    save_summary_batch(channel_name, {
+        "batch_id": batch_id,
+        "video_ids": sorted(batch_ids),
+        "submitted": datetime.now(timezone.utc).isoformat(),
+    })
+    _log(log_callback, f"Submitted {len(items)} summaries as a batch; a later sync collects them")
+    return batch_ids
+
+
 def _update_download(
     vp: VideoProgress,
     progress: float,
@@ -364,6 +648,46 @@ def _emit(callback: SyncCallback | None, prog: ChannelSyncProgress) -> None:
             logger.debug("Progress callback error: %s", exc)
 
 
+def _coalesced_callback(callback: SyncCallback | None) -> SyncCallback | None:
+    """Wrap a progress callback so it fires at most every ``PROGRESS_EMIT_INTERVAL``.
+
+    Progress objects are mutated in place, so an update that arrives too soon
+    after the last delivery only needs one deferred delivery scheduled; any
+    further updates before it fires ride along.  Final updates (``done``) are
+    always delivered immediately.  Must be created and called on the event
+    loop thread.
+
+    Args:
+        callback: The UI progress callback, or None.
+
+    Returns:
+        The coalescing callback, or None if *callback* is None.
+    """
+    if callback is None:
+        return None
+    loop = asyncio.get_running_loop()
+    state: dict[str, Any] = {"handle": None, "last": 0.0, "prog": None}
+
+    def _deliver() -> None:
+        state["handle"] = None
+        state["last"] = time.monotonic()
+        _emit(callback, state["prog"])
+
+    def _report(prog: ChannelSyncProgress) -> None:
+        state["prog"] = prog
+        if state["handle"] is not None:
+            if not prog.done:
+                return
+            state["handle"].cancel()
+        wait = state["last"] + PROGRESS_EMIT_INTERVAL - time.monotonic()
+        if prog.done or wait <= 0:
+            _deliver()
+        else:
+            state["handle"] = loop.call_later(wait, _deliver)
+
+    return _report
+
+
 def _log(callback: LogCallback | None, msg: Any) -> None:
     if callback:
         try:
@@ -379,16 +703,19 @@ async def sync_all_channels(
 ) -> None:
     """Sync all auto-sync channels concurrently.
 
-    Channel video lists are fetched in parallel.  As soon as a channel's
-    fetch finishes its slot is released into a pool and that channel's videos
-    start processing immediately — other channels still fetching do not block
-    it.
+    Channel video lists are fetched in parallel, at most ``concurrency`` at a
+    time, and failed listings are retried after a jittered backoff.  As soon
+    as a channel's fetch finishes its slot is released into a pool and that
+    channel's videos start processing immediately — other channels still
+    fetching do not block it.  Each UI slot has one owner at a time: a fetch
+    until it hands the slot to a worker, then that worker.
 
     Args:
         progress_callback: Optional callback for progress updates.
         log_callback: Optional callback for channel-level log lines (→ slot 0).
         slot_log_callback: Optional callback for per-slot log lines.
     """
+    progress_callback = _coalesced_callback(progress_callback)
     config = load_config()
     channels_cfg = config.get("channels", [])
     proxy = load_proxy_url()
@@ -405,16 +732,28 @@ async def sync_all_channels(
     auto_sync_channels = [ch for ch in channels_cfg if ch.get("auto_sync", True)]
     channel_quality: dict[str, str] = {}
     synced_channels: set[str] = set()
-    process_tasks: list[asyncio.Task] = []
-
-    # Slot pool starts empty.  Each _fetch_one deposits its slot when it
-    # finishes so that _process_one tasks can start as fetches complete
-    # rather than waiting for all fetches to finish first.
-    slot_pool: asyncio.Queue[int] = asyncio.Queue()
-
-    async def _process_one(ch_name: str, video: dict[str, Any]) -> None:
-        slot_idx = await slot_pool.get()
 
+    # Videos from every channel feed one queue.  A worker owning a UI slot is
+    # started as each fetch releases that slot, so processing begins as soon
+    # as the first listing arrives rather than after all fetches finish.
+    work_queue: asyncio.Queue[tuple[str, dict[str, Any]]] = asyncio.Queue()
+    workers: list[asyncio.Task] = []
+    released_slots: set[int] = set()
+    download_gate = None if proxy else _DownloadGate(INTER_REQUEST_DELAY)
+    writer = LibraryWriter()
+
+    # At most `concurrency` listings are fetched at once.  A fetch borrows a
+    # UI slot only while no worker owns it yet and hands it to a worker when
+    # done; later fetches report through the channel-level log instead.
+    fetch_sem = asyncio.Semaphore(concurrency)
+    fetch_display: set[int] = set()
+
+    def _release_slot(slot_idx: int) -> None:
+        if slot_idx not in released_slots:
+            released_slots.add(slot_idx)
+            workers.append(asyncio.create_task(_worker(slot_idx)))
+
+    async def _worker(slot_idx: int) -> None:
         def _slot_log(msg: Any) -> None:
             if slot_log_callback:
                 try:
@@ -422,65 +761,83 @@ async def sync_all_channels(
                 except Exception:
                     pass
 
-        quality = channel_quality[ch_name]
-        try:
-            await _process_video(
-                ch_name, video, quality, prog, slot_idx,
-                progress_callback, _slot_log,
-            )
-        except Exception as exc:
-            msg = f"Failed to process {video.get('video_id')}: {exc}"
-            logger.error(msg)
-            _slot_log(f"ERROR: {msg}")
-        finally:
-            prog.slots[slot_idx] = None
-            slot_pool.put_nowait(slot_idx)
-        prog.completed += 1
-        _emit(progress_callback, prog)
-
-    async def _fetch_one(ch: dict[str, Any], slot_idx: int) -> None:
+        while True:
+            ch_name, video = await work_queue.get()
+            try:
+                await _process_video(
+                    ch_name, video, channel_quality[ch_name], prog, slot_idx,
+                    progress_callback, _slot_log, download_gate, writer.upsert,
+                )
+            except Exception as exc:
+                msg = f"Failed to process {video.get('video_id')}: {exc}"
+                logger.error(msg)
+                _slot_log(f"ERROR: {msg}")
+            finally:
+                prog.slots[slot_idx] = None
+                # Persist the finished video's flags before taking the next one.
+                try:
+                    writer.flush()
+                except Exception as exc:
+                    logger.error("Failed to save library updates: %s", exc)
+                prog.completed += 1
+                _emit(progress_callback, prog)
+                work_queue.task_done()
+
+    async def _fetch_one(ch: dict[str, Any]) -> None:
         ch_name = ch["name"]
         ch_url = ch["url"]
         quality = QUALITY_MAP.get(ch.get("quality", "high"), "1080p")
+        slot_idx: int | None = None
 
         def _slog(msg: Any) -> None:
-            if slot_log_callback:
+            if slot_idx is None or slot_idx in released_slots:
+                _log(log_callback, msg)
+            elif slot_log_callback:
                 try:
                     slot_log_callback(slot_idx, msg)
                 except Exception:
                     pass
 
-        # Show "Fetching video list…" in the slot header while fetching.
-        prog.slots[slot_idx] = VideoProgress(
-            video_id="", title="Fetching video list\u2026", channel_name=ch_name, fetching=True,
-        )
-        _emit(progress_callback, prog)
+        async with fetch_sem:
+            free = [idx for idx in range(concurrency) if idx not in released_slots | fetch_display]
+            if free:
+                # Show "Fetching video list…" in the slot header while fetching.
+                slot_idx = free[0]
+                fetch_display.add(slot_idx)
+                prog.slots[slot_idx] = VideoProgress(
+                    video_id="", title="Fetching video list\u2026", channel_name=ch_name, fetching=True,
+                )
+                _emit(progress_callback, prog)
 
-        library = load_library(ch_name)
-        existing_ids = {v["video_id"] for v in library.get("videos", [])}
-        stop_at_ids = {
-            v["video_id"] for v in library.get("videos", [])
-            if v.get("has_video") and v.get("has_transcript") and v.get("has_summary")
-        }
+            scan = _scan_library(load_library(ch_name))
+            existing_ids = scan.existing_ids
 
-        has_any_date = any(v.get("upload_date") for v in library.get("videos", []))
-        effective_stop_at_ids = stop_at_ids if has_any_date else None
-        if not has_any_date and existing_ids:
-            _slog("No publish dates in library — fetching full listing to populate dates…")
+            effective_stop_at_ids = scan.stop_at_ids if scan.has_any_date else None
+            if not scan.has_any_date and existing_ids:
+                _slog("No publish dates in library — fetching full listing to populate dates…")
 
-        _slog(f"=== Fetching video list: {ch_name} ===")
-        try:
-            remote_videos = await fetch_channel_videos(
-                ch_url, log_callback=_slog, stop_at_ids=effective_stop_at_ids,
-            )
-        except Exception as exc:
-            _slog(f"ERROR fetching {ch_name}: {exc}")
-            return
-        finally:
-            # Release slot so a process task can use it immediately.
-            prog.slots[slot_idx] = None
-            slot_pool.put_nowait(slot_idx)
-            _emit(progress_callback, prog)
+            _slog(f"=== Fetching video list: {ch_name} ===")
+            try:
+                for attempt in range(FETCH_MAX_RETRIES + 1):
+                    try:
+                        remote_videos = await fetch_channel_videos(
+                            ch_url, log_callback=_slog, stop_at_ids=effective_stop_at_ids,
+                        )
+                        break
+                    except Exception as exc:
+                        if attempt == FETCH_MAX_RETRIES:
+                            _slog(f"ERROR fetching {ch_name}: {exc}")
+                            return
+                        delay = FETCH_RETRY_BASE_DELAY * 2 ** attempt + random.uniform(0, FETCH_RETRY_JITTER)
+                        _slog(f"Fetch failed for {ch_name} ({exc}); retrying in {delay:.0f}s…")
+                        await asyncio.sleep(delay)
+            finally:
+                if slot_idx is not None:
+                    # Hand the slot to a processing worker immediately.
+                    fetch_display.discard(slot_idx)
+                    prog.slots[slot_idx] = None
+                    _release_slot(slot_idx)
+                    _emit(progress_callback, prog)
 
         # Backfill upload_date for existing entries missing it.
         remote_dates = {v["video_id"]: v["upload_date"] for v in remote_videos if v.get("upload_date")}
@@ -488,15 +845,13 @@ async def sync_all_channels(
             batch_update_upload_dates(ch_name, remote_dates)
 
         new_videos = [v for v in remote_videos if v["video_id"] not in existing_ids]
-        backfill = [
-            v for v in library.get("videos", [])
-            if (not v.get("has_transcript") or not v.get("has_summary"))
-            and not v.get("members_only")
-        ]
+        backfill = scan.backfill
+        batched_ids = await _advance_summary_batch(ch_name, backfill, _slog)
+        if batched_ids:
+            backfill = [v for v in backfill if v["video_id"] not in batched_ids]
         to_process = new_videos + backfill
 
-        for v in new_videos:
-            upsert_video(ch_name, v)
+        upsert_videos_bulk(ch_name, new_videos)
 
         if to_process:
             channel_quality[ch_name] = quality
@@ -505,14 +860,21 @@ async def sync_all_channels(
             _emit(progress_callback, prog)
             _slog(f"{ch_name}: {len(new_videos)} new, {len(backfill)} to backfill")
             for video in to_process:
-                process_tasks.append(asyncio.create_task(_process_one(ch_name, video)))
+                work_queue.put_nowait((ch_name, video))
         else:
             _slog(f"{ch_name}: up to date")
 
-    await asyncio.gather(*[
-        _fetch_one(ch, i % NUM_SLOTS)
-        for i, ch in enumerate(auto_sync_channels)
-    ])
+    try:
+        await asyncio.gather(*[_fetch_one(ch) for ch in auto_sync_channels])
+        # Fewer channels than slots: hand the unused slots to processing too.
+        for idx in range(concurrency):
+            _release_slot(idx)
+        await work_queue.join()
+    finally:
+        for worker in workers:
+            worker.cancel()
+        writer.flush()
+        close_ydl_pool()
 
     if not synced_channels:
         _log(log_callback, "All channels are up to date.")
@@ -520,9 +882,6 @@ async def sync_all_channels(
         _emit(progress_callback, prog)
         return
 
-    if process_tasks:
-        await asyncio.gather(*process_tasks)
-
     for ch_name in synced_channels:
         mark_library_synced(ch_name)
 
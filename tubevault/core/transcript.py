@@ -1,17 +1,40 @@
 """Transcript fetching and parsing with timestamps."""
 
 import asyncio
+import contextlib
 import logging
-from pathlib import Path
-from typing import Any, Callable
+import random
+import re
+from typing import Any, BinaryIO, Callable
 
-from tubevault.core.database import video_dir
-from tubevault.utils.helpers import ensure_dir, load_proxy_url, run_in_daemon_thread
+try:
+    import ijson
+except ImportError:  # ijson is optional; subtitle files are parsed whole instead
+    ijson = None
+
+from tubevault.utils.helpers import json_loads, load_proxy_url, run_in_daemon_thread
 
 logger = logging.getLogger(__name__)
 
 MAX_RETRIES = 3
 RETRY_BASE_DELAY = 2.0
+# Upper bound (seconds) of the random delay added to each retry so parallel
+# workers that failed together do not all retry at the same instant.
+RETRY_JITTER = 1.5
+
+# One WebVTT cue: "<start> --> <end> [settings]" followed by its non-blank
+# text lines (the block ends at the first blank line or end of file).
+_VTT_CUE_RE = re.compile(
+    r"^[ \t]*(\S+)[ \t]+-->[ \t]+(\S+)[^\n]*\n((?:[ \t]*\S[^\n]*(?:\n|\Z))*)",
+    re.MULTILINE,
+)
+
+# VTT timestamp: [HH:]MM:SS[.mmm]
+_VTT_TIME_RE = re.compile(r"(?:(\d+):)?(\d+):(\d+(?:\.\d*)?)")
+
+# youtube-transcript-api errors that also mean "no captions, ever" but are
+# not exported by every supported release (1.x dropped NoTranscriptAvailable).
+_OPTIONAL_PERMANENT_ERRORS = ("InvalidVideoId", "NoTranscriptAvailable")
 
 LogCallback = Callable[[str], None]
 
@@ -24,7 +47,7 @@ async def fetch_transcript(
     """Fetch transcript for a video, trying youtube-transcript-api then yt-dlp.
 
     Args:
-        channel_name: Channel slug (used for directory lookup).
+        channel_name: Channel slug the video belongs to.
         video_id: YouTube video ID.
         log_callback: Optional callback for status lines.
 
@@ -42,13 +65,17 @@ async def fetch_transcript(
                 if log_callback:
                     log_callback(f"Transcript fetched ({len(segments)} segments)")
                 return segments
+            # No captions through this API is permanent; retrying cannot help.
+            break
         except Exception as exc:
             msg = f"youtube-transcript-api attempt {attempt}/{MAX_RETRIES} failed for {video_id}: {exc}"
             logger.warning(msg)
             if log_callback:
                 log_callback(msg)
             if attempt < MAX_RETRIES:
-                await asyncio.sleep(RETRY_BASE_DELAY ** attempt)
+                await asyncio.sleep(
+                    RETRY_BASE_DELAY * 2 ** (attempt - 1) + random.uniform(0, RETRY_JITTER)
+                )
 
     # Fallback: yt-dlp subtitle extraction
     msg = f"Falling back to yt-dlp subtitles for {video_id}"
@@ -56,7 +83,7 @@ async def fetch_transcript(
     if log_callback:
         log_callback(msg)
     try:
-        segments = await run_in_daemon_thread(_fetch_via_ytdlp, channel_name, video_id, log_callback)
+        segments = await run_in_daemon_thread(_fetch_via_ytdlp, video_id, log_callback)
         if segments:
             if log_callback:
                 log_callback(f"Subtitles fetched via yt-dlp ({len(segments)} segments)")
@@ -78,13 +105,30 @@ async def fetch_transcript(
 
 
 def _fetch_via_transcript_api(video_id: str) -> list[dict[str, Any]] | None:
-    """Use youtube-transcript-api to fetch auto-generated or manual captions."""
+    """Use youtube-transcript-api to fetch auto-generated or manual captions.
+
+    Returns None for permanent failures (captions disabled or missing, video
+    unavailable, library not installed).  Transient errors such as rate
+    limiting or network failures propagate so the caller can retry them.
+    """
     try:
-        from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
+        import youtube_transcript_api
+        from youtube_transcript_api import (
+            NoTranscriptFound,
+            TranscriptsDisabled,
+            VideoUnavailable,
+            YouTubeTranscriptApi,
+        )
     except ImportError:
         logger.error("youtube-transcript-api not installed")
         return None
 
+    permanent_errors = (NoTranscriptFound, TranscriptsDisabled, VideoUnavailable) + tuple(
+        exc
+        for exc in (getattr(youtube_transcript_api, name, None) for name in _OPTIONAL_PERMANENT_ERRORS)
+        if exc is not None
+    )
+
     proxy = load_proxy_url()
     proxies = {"http": proxy, "https": proxy} if proxy else None
 
@@ -94,23 +138,24 @@ def _fetch_via_transcript_api(video_id: str) -> list[dict[str, Any]] | None:
             kwargs["proxies"] = proxies
         segments = YouTubeTranscriptApi.get_transcript(video_id, **kwargs)
         return [{"text": s["text"], "start": s["start"], "duration": s.get("duration", 0)} for s in segments]
-    except (TranscriptsDisabled, NoTranscriptFound):
+    except permanent_errors:
         return None
 
 
 def _fetch_via_ytdlp(
-    channel_name: str,
     video_id: str,
     log_callback: LogCallback | None = None,
 ) -> list[dict[str, Any]] | None:
-    """Use yt-dlp to download subtitles and parse them."""
-    import yt_dlp
+    """Use yt-dlp to locate subtitles and parse them.
+
+    Only the extractor runs: yt-dlp picks the caption track (json3, then
+    vtt) and the track is read straight from its URL, with no temporary
+    subtitle file written to or globbed from the video directory.
+    """
     from tubevault.core.downloader import (
-        BotCheckError, MembersOnlyError, _BOT_CHECK_RE, _MEMBERS_ONLY_RE, _YdlLogger,
+        BotCheckError, MembersOnlyError, _BOT_CHECK_RE, _MEMBERS_ONLY_RE, _YdlLogger, _pooled_ydl,
     )
 
-    out_dir = video_dir(channel_name, video_id)
-    ensure_dir(out_dir)
     url = f"https://www.youtube.com/watch?v={video_id}"
 
     _members_only: list[bool] = [False]
@@ -124,106 +169,98 @@ def _fetch_via_ytdlp(
         if log_callback:
             log_callback(msg)
 
+    # Pooled instances are shared across videos; the logger is per-video.
+    with _pooled_ydl("subtitles", _subtitle_opts) as ydl:
+        ydl.params["logger"] = _YdlLogger(_wrapped_log)
+        info = ydl.extract_info(url, download=False)
+
+        if _bot_check[0]:
+            raise BotCheckError(f"Bot check triggered for transcript: {video_id}")
+
+        if _members_only[0]:
+            raise MembersOnlyError(f"Members-only video: {video_id}")
+
+        # requested_subtitles holds the track yt-dlp chose for
+        # subtitleslangs/subtitlesformat, manual subtitles before automatic.
+        track = ((info or {}).get("requested_subtitles") or {}).get("en")
+        if not track:
+            return None
+        ext = track.get("ext")
+        if ext not in ("json3", "vtt"):
+            return None
+        with contextlib.closing(ydl.urlopen(track["url"])) as response:
+            if ext == "json3":
+                return _parse_json3_subtitles(response)
+            return _parse_vtt_subtitles(response.read().decode("utf-8", errors="replace"))
+
+
+def _subtitle_opts(proxy: str | None) -> dict[str, Any]:
+    """Build yt-dlp options for subtitle track selection."""
     opts: dict[str, Any] = {
         "skip_download": True,
         "writeautomaticsub": True,
         "writesubtitles": True,
-        "subtitlesformat": "json3",
+        "subtitlesformat": "json3/vtt/best",
         "subtitleslangs": ["en"],
-        "outtmpl": str(out_dir / "sub.%(ext)s"),
         "quiet": True,
         "no_warnings": True,
         "noprogress": True,
         "remote_components": ["ejs:github"],
     }
-    proxy = load_proxy_url()
     if proxy:
         opts["proxy"] = proxy
-    opts["logger"] = _YdlLogger(_wrapped_log)
-
-    with yt_dlp.YoutubeDL(opts) as ydl:
-        ydl.download([url])
-
-    if _bot_check[0]:
-        raise BotCheckError(f"Bot check triggered for transcript: {video_id}")
+    return opts
 
-    if _members_only[0]:
-        raise MembersOnlyError(f"Members-only video: {video_id}")
 
-    # Parse the downloaded json3 subtitle file
-    for sub_file in out_dir.glob("sub.*.json3"):
-        return _parse_json3_subtitles(sub_file)
-
-    # Try vtt format
-    opts["subtitlesformat"] = "vtt"
-    opts["outtmpl"] = str(out_dir / "sub2.%(ext)s")
-    with yt_dlp.YoutubeDL(opts) as ydl:
-        ydl.download([url])
-
-    for sub_file in out_dir.glob("sub2.*.vtt"):
-        return _parse_vtt_subtitles(sub_file)
-
-    return None
-
-
-def _parse_json3_subtitles(path: Path) -> list[dict[str, Any]]:
-    """Parse yt-dlp json3 subtitle format."""
-    import json
-
-    with path.open() as f:
-        data = json.load(f)
+def _parse_json3_subtitles(f: BinaryIO) -> list[dict[str, Any]]:
+    """Parse yt-dlp json3 subtitle format from a binary stream.
 
+    With ijson installed the events are streamed one at a time, so a long
+    subtitle track is never held in memory as a whole document; otherwise
+    the track is decoded in one go through ``json_loads`` (orjson when
+    available).
+    """
     segments = []
-    for event in data.get("events", []):
-        start_ms = event.get("tStartMs", 0)
-        dur_ms = event.get("dDurationMs", 0)
-        segs = event.get("segs", [])
-        text = "".join(s.get("utf8", "") for s in segs).strip()
-        if text and text != "\n":
-            segments.append(
-                {
-                    "text": text,
-                    "start": start_ms / 1000.0,
-                    "duration": dur_ms / 1000.0,
-                }
-            )
+    if ijson is not None:
+        events = ijson.items(f, "events.item", use_float=True)
+    else:
+        events = json_loads(f.read()).get("events", [])
+    append = segments.append
+    for event in events:
+        segs = event.get("segs")
+        if not segs:
+            continue
+        text = "".join([s["utf8"] for s in segs if "utf8" in s]).strip()
+        if not text:
+            continue
+        append(
+            {
+                "text": text,
+                "start": event.get("tStartMs", 0) / 1000.0,
+                "duration": event.get("dDurationMs", 0) / 1000.0,
+            }
+        )
     return segments
 
 
-def _parse_vtt_subtitles(path: Path) -> list[dict[str, Any]]:
-    """Parse WebVTT subtitle file into segments."""
-    content = path.read_text(encoding="utf-8", errors="replace")
+def _parse_vtt_subtitles(content: str) -> list[dict[str, Any]]:
+    """Parse WebVTT subtitle text into segments."""
     segments = []
-    lines = content.splitlines()
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        if "-->" in line:
-            parts = line.split("-->")
-            start = _vtt_time_to_seconds(parts[0].strip())
-            end = _vtt_time_to_seconds(parts[1].strip().split()[0])
-            i += 1
-            text_lines = []
-            while i < len(lines) and lines[i].strip():
-                text_lines.append(lines[i].strip())
-                i += 1
-            text = " ".join(text_lines)
-            if text:
-                segments.append({"text": text, "start": start, "duration": max(0, end - start)})
-        else:
-            i += 1
+    for match in _VTT_CUE_RE.finditer(content):
+        text = " ".join(line.strip() for line in match.group(3).splitlines())
+        if text:
+            start = _vtt_time_to_seconds(match.group(1))
+            end = _vtt_time_to_seconds(match.group(2))
+            segments.append({"text": text, "start": start, "duration": max(0, end - start)})
     return segments
 
 
 def _vtt_time_to_seconds(time_str: str) -> float:
     """Convert VTT time string (HH:MM:SS.mmm or MM:SS.mmm) to seconds."""
-    parts = time_str.split(":")
-    if len(parts) == 3:
-        h, m, s = parts
-        return int(h) * 3600 + int(m) * 60 + float(s)
-    elif len(parts) == 2:
-        m, s = parts
-        return int(m) * 60 + float(s)
+    match = _VTT_TIME_RE.fullmatch(time_str)
+    if match:
+        h, m, s = match.groups()
+        return int(h or 0) * 3600 + int(m) * 60 + float(s)
     return float(time_str)
 
 
@@ -13,9 +13,10 @@ from tubevault.core.database import (
     collection_add_video,
     collection_insert_header,
     collection_set_note,
+    get_video_entry,
+    iter_library_videos,
     list_library_page_nums,
     load_collection,
-    load_library,
     load_library_page,
 )
 from tubevault.widgets.collection_list import CollectionList
@@ -144,8 +145,7 @@ class LibraryBrowserScreen(Screen):
 
     def _load_collection(self) -> None:
         collection = load_collection(self._channel_name)
-        library = load_library(self._channel_name)
-        video_map = {v["video_id"]: v for v in library.get("videos", [])}
+        video_map = {v["video_id"]: v for v in iter_library_videos(self._channel_name)}
         self.query_one("#collection_list", CollectionList).set_items(
             collection.get("items", []), video_map
         )
@@ -180,9 +180,7 @@ class LibraryBrowserScreen(Screen):
 
     # ------------------------------------------------------------------ CollectionList events
     def on_collection_list_video_selected(self, event: CollectionList.VideoSelected) -> None:
-        library = load_library(self._channel_name)
-        video_map = {v["video_id"]: v for v in library.get("videos", [])}
-        video = video_map.get(event.video_id)
+        video = get_video_entry(self._channel_name, event.video_id)
         if video:
             self._open_video(video)
 
@@ -241,7 +241,7 @@ class SyncScreen(Screen):
         self._populate_config_label()
 
         # Replay per-slot logs accumulated while this screen was not visible.
-        slot_logs = getattr(self.app, "sync_slot_logs", [[], [], [], []])
+        slot_logs = getattr(self.app, "sync_slot_logs", [])
         for i in range(SLOT_COUNT):
             logs = slot_logs[i] if i < len(slot_logs) else []
             try:
@@ -257,7 +257,7 @@ class SyncScreen(Screen):
 
         # Only start a new sync if one is not already running.
         if not self.app.sync_running:
-            self.app.sync_slot_logs = [[], [], [], []]
+            self.app.reset_sync_logs()
             self.app.sync_progress = None
             self.app.run_worker(self._run_sync(), exclusive=False)
 
@@ -291,10 +291,7 @@ class SyncScreen(Screen):
             try:
                 if self._channel_name and self._channel_url:
                     config = load_config()
-                    ch = next(
-                        (c for c in config.get("channels", []) if c["name"] == self._channel_name),
-                        {},
-                    )
+                    ch = {c["name"]: c for c in config.get("channels", [])}.get(self._channel_name, {})
                     quality = QUALITY_MAP.get(ch.get("quality", "high"), "1080p")
                     max_concurrent = config.get("max_concurrent_downloads", 2)
                     await sync_channel(
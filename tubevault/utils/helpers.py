@@ -1,14 +1,28 @@
 """Shared utility functions for TubeVault."""
 
 import asyncio
+import functools
+import json
 import logging
+import os
 import threading
-from datetime import timedelta
 from pathlib import Path
 from typing import Any, Callable
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Whether atomic_write_bytes fsyncs by default.  Off unless TUBEVAULT_FSYNC is
+# set to a truthy value: syncing every library page dominates large syncs.
+FSYNC_WRITES = os.environ.get("TUBEVAULT_FSYNC", "").strip().lower() in ("1", "true", "yes", "on")
+
+# Directories already created by ensure_dir in this process.
+_ENSURED_DIRS: set[Path] = set()
+
 
 async def run_in_daemon_thread(func: Callable[..., Any], *args: Any) -> Any:
     """Run a blocking function on a daemon thread and await the result.
@@ -33,6 +47,85 @@ async def run_in_daemon_thread(func: Callable[..., Any], *args: Any) -> Any:
     return await fut
 
 
+def json_loads(data: bytes | str) -> Any:
+    """Decode JSON text, using orjson when it is installed.
+
+    Args:
+        data: Raw JSON as bytes or str.
+
+    Returns:
+        The decoded Python object.
+
+    Raises:
+        json.JSONDecodeError: If the input is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, compact: bool = False) -> bytes:
+    """Encode an object as UTF-8 JSON with a trailing newline.
+
+    Args:
+        obj: JSON-serializable object.
+        compact: If True, omit indentation and spacing.  Used for files that
+            are only ever read by TubeVault itself.
+
+    Returns:
+        Encoded JSON bytes, 2-space indented unless *compact*.
+    """
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE if compact else orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, option=option)
+    if compact:
+        return (json.dumps(obj, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
+    return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def atomic_write_bytes(path: Path, data: bytes, fsync: bool | None = None) -> None:
+    """Write bytes to a file atomically.
+
+    The data is written to a sibling temp file (unique per thread, so
+    concurrent writers never share one) which is then renamed over *path*, so
+    readers (and a process killed mid-write) only ever see the old or the new
+    contents, never a truncated file.  If *path* already holds exactly *data*
+    the write is skipped.
+
+    Args:
+        path: Destination file path.
+        data: Bytes to write.
+        fsync: If True, flush the temp file to disk before the rename and the
+            parent directory after it, so the new contents survive a power
+            loss.  Defaults to ``FSYNC_WRITES`` (the ``TUBEVAULT_FSYNC`` env
+            var).
+    """
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return
+    except OSError:
+        pass
+    if fsync is None:
+        fsync = FSYNC_WRITES
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with tmp.open("wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    if fsync and hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
 def format_duration(seconds: int) -> str:
     """Format duration in seconds to HH:MM:SS or MM:SS string.
 
@@ -42,9 +135,7 @@ def format_duration(seconds: int) -> str:
     Returns:
         Formatted duration string.
     """
-    td = timedelta(seconds=seconds)
-    total_seconds = int(td.total_seconds())
-    hours, remainder = divmod(total_seconds, 3600)
+    hours, remainder = divmod(int(seconds), 3600)
     minutes, secs = divmod(remainder, 60)
     if hours:
         return f"{hours}:{minutes:02d}:{secs:02d}"
@@ -67,13 +158,18 @@ def format_timestamp(seconds: int) -> str:
 def ensure_dir(path: Path) -> Path:
     """Ensure a directory exists, creating it if necessary.
 
+    Each directory is only created once per process; later calls for the same
+    path return without touching the filesystem.
+
     Args:
         path: Directory path to ensure.
 
     Returns:
         The path, guaranteed to exist.
     """
-    path.mkdir(parents=True, exist_ok=True)
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
     return path
 
 
@@ -104,9 +200,13 @@ def load_proxy_url() -> str | None:
     return f"http://{host}:{port}"
 
 
+@functools.lru_cache(maxsize=1)
 def tubevault_root() -> Path:
     """Return the root TubeVault data directory.
 
+    The result is cached so the directory is only created once per process;
+    call ``tubevault_root.cache_clear()`` after changing ``HOME``.
+
     Returns:
         Path to ~/TubeVault/.
     """